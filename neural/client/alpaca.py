@@ -496,10 +496,10 @@ class AlpacaClient(AbstractClient):
         try:
             account = self.clients['trading'].get_account()
             if not self.account.status == AccountStatus.ACTIVE:
-                logger.warning(f'Account Status: {self.account.status}')
+                logger.warning('Account Status: %s', self.account.status)
 
         except Exception as exception:
-            logger.exception(f'Account setup failed: {exception}')
+            logger.exception('Account setup failed: %s', exception)
 
         return account
 
@@ -967,13 +967,15 @@ class AlpacaDataClient(AbstractDataClient, AlpacaClient):
             if alpaca_asset is None:
                 raise ValueError(f'Symbol {symbol} is not a known symbol.')
             if not alpaca_asset.tradable:
-                logger.warning(f'Symbol {symbol} is not a tradable symbol.')
+                logger.warning('Symbol %s is not a tradable symbol.', symbol)
             if alpaca_asset.status != AssetStatus.ACTIVE:
-                logger.warning(f'Symbol {symbol} is not an active symbol.')
+                logger.warning('Symbol %s is not an active symbol.', symbol)
             if not alpaca_asset.fractionable:
-                logger.warning(f'Symbol {symbol} is not a fractionable symbol.')
+                logger.warning('Symbol %s is not a fractionable symbol.',
+                               symbol)
             if not alpaca_asset.easy_to_borrow:
-                logger.warning(f'Symbol {symbol} is not easy to borrow (ETB).')
+                logger.warning('Symbol %s is not easy to borrow (ETB).',
+                               symbol)
 
             asset_type = asset_type_map[alpaca_asset.asset_class]
             maintenance_margin = (alpaca_asset.maintenance_margin_requirement /
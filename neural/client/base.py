@@ -63,7 +63,8 @@ Classes:
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, List
 
 import numpy as np
 
@@ -317,3 +318,32 @@ class AbstractTradeClient(AbstractClient):
         restrictions of the API should be enforced in this method.
         """
         raise NotImplementedError
+
+    def place_orders(self, orders: List[Dict], *args, **kwargs) -> None:
+        """
+        Places a batch of orders. Clients backed by an API with a
+        native bulk submission endpoint should override this method
+        with a single batched call. The default implementation
+        dispatches the single-asset place_order calls concurrently so
+        total submission latency is bounded by the slowest round trip
+        instead of the sum of all round trips.
+
+        Args:
+        ----
+            orders (List[Dict]):
+                A list of keyword argument dictionaries, one per order,
+                each forwarded to place_order.
+        """
+        if not orders:
+            return None
+
+        with ThreadPoolExecutor(
+                max_workers=min(len(orders), 32)) as executor:
+            futures = [
+                executor.submit(self.place_order, *args, **order, **kwargs)
+                for order in orders
+            ]
+            for future in futures:
+                future.result()
+
+        return None
@@ -41,7 +41,13 @@ Notes:
     If LOG_PATH is provided, creates a rotating file handler with the
     specified file name, maximum size, and backup count. If LOG_PATH is
     None, then set the file handler to a NullHandler, which will not log
-    any messages to a file. 
+    any messages to a file.
+
+    Log calls should use lazy %-style formatting, e.g.
+    logger.info('loaded pipe %s', path), never f-strings, so that
+    message interpolation is skipped when the record is filtered. This
+    contract is enforced by the logging-fstring-interpolation pylint
+    check enabled in the repository .pylintrc.
 
 Example:
 ---------
@@ -57,8 +63,13 @@ Example:
     >>> logger.critical('This is a critical message.')
 """
 
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import os
+import queue
+import socket
+from logging.handlers import (MemoryHandler, QueueHandler, QueueListener,
+                              RotatingFileHandler)
 from neural.common.constants import (
     LOG_PATH, MAX_LOG_SIZE, LOG_BACKUP_COUNT, LOG_LEVEL
 )
@@ -67,26 +78,79 @@ from neural.common.constants import (
 
 logger = logging.getLogger('neural')
 logger.setLevel(LOG_LEVEL)
+logger.propagate = False
+
+# Collecting threading/process/caller info for every record requires
+# extra syscalls and frame introspection; none of it is used by the
+# formatter of this package.
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+logging._srcfile = None
+
+# Hostname and process id are constant for the lifetime of the process;
+# resolving them per record would cost a syscall each. Precomputed here
+# and injected into every record so formatters can reference
+# %(hostname)s and %(pid)d without per-record lookups.
+_HOSTNAME = socket.gethostname()
+_PID = os.getpid()
+
+class _ContextFilter(logging.Filter):
+    """
+    Injects the cached hostname and process id into every log record.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.hostname = _HOSTNAME
+        record.pid = _PID
+        return True
 
 # =========================file/console handler=============================
 
-if LOG_PATH is not None:
-    file_handler = RotatingFileHandler(filename=LOG_PATH,
-                                       maxBytes=MAX_LOG_SIZE,
-                                       backupCount=LOG_BACKUP_COUNT)
-else:
-    file_handler = logging.NullHandler()
-file_handler.setLevel(LOG_LEVEL)
+if not logger.hasHandlers():
+
+    logger.addFilter(_ContextFilter())
+
+    if LOG_PATH is not None:
+        file_handler = RotatingFileHandler(filename=LOG_PATH,
+                                           maxBytes=MAX_LOG_SIZE,
+                                           backupCount=LOG_BACKUP_COUNT)
+    else:
+        file_handler = logging.NullHandler()
+    file_handler.setLevel(LOG_LEVEL)
+
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(LOG_LEVEL)
 
-console_handler = logging.StreamHandler()
-console_handler.setLevel(LOG_LEVEL)
+    if LOG_PATH is not None:
+        # The rotating file handler performs a seek/tell plus a write
+        # per record. Buffering records in memory amortizes that cost
+        # over many records; errors and shutdown flush immediately.
+        buffered_file_handler = MemoryHandler(capacity=512,
+                                              flushLevel=logging.ERROR,
+                                              target=file_handler,
+                                              flushOnClose=True)
+        buffered_file_handler.setLevel(LOG_LEVEL)
+        atexit.register(buffered_file_handler.flush)
 
-logger.addHandler(file_handler)
-logger.addHandler(console_handler)
+        # Disk I/O happens on a background listener thread; callers only
+        # pay the cost of an enqueue.
+        log_record_queue = queue.SimpleQueue()
+        queue_handler = QueueHandler(log_record_queue)
+        queue_handler.setLevel(LOG_LEVEL)
+        queue_listener = QueueListener(log_record_queue,
+                                       buffered_file_handler,
+                                       respect_handler_level=True)
+        queue_listener.start()
+        atexit.register(queue_listener.stop)
+        logger.addHandler(queue_handler)
+    else:
+        logger.addHandler(file_handler)
+    logger.addHandler(console_handler)
 
-# =========================logger formatter=============================
+    # =========================logger formatter=============================
 
-formatter = logging.Formatter('%(levelname)s - %(message)s')
+    formatter = logging.Formatter('%(levelname)s - %(message)s')
 
-file_handler.setFormatter(formatter)
-console_handler.setFormatter(formatter)
+    file_handler.setFormatter(formatter)
+    console_handler.setFormatter(formatter)
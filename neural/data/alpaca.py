@@ -716,12 +716,14 @@ class AlpacaDataDownloader():
 
         days = len(schedule)
         n_assets = len(assets)
-        logger.info('Downloading dataset:'
-                    f'\n\t start = {start_date}'
-                    f'\n\t end = {end_date}'
-                    f'\n\t days = {days}'
-                    f'\n\t resolution = {resolution}'
-                    f'\n\t n_assets = {n_assets}')
+        logger.info(
+            'Downloading dataset:'
+            '\n\t start = %s'
+            '\n\t end = %s'
+            '\n\t days = %s'
+            '\n\t resolution = %s'
+            '\n\t n_assets = %s', start_date, end_date, days, resolution,
+            n_assets)
         progress_bar_ = progress_bar(len(schedule))
 
         for start, end in schedule.values:
@@ -81,6 +81,10 @@ from collections import OrderedDict, defaultdict
 from copy import deepcopy
 from dataclasses import dataclass
 from datetime import datetime
+from functools import cached_property
+from multiprocessing import shared_memory
+import queue
+import threading
 from typing import (TYPE_CHECKING, Dict, List, Callable, Iterable, Optional)
 
 import h5py as h5
@@ -93,6 +97,16 @@ from neural.data.enums import FeatureType, AssetType, CalendarType
 if TYPE_CHECKING:
     from neural.utils.time import Resolution
 
+# Live data clients run their websocket streams on asyncio event
+# loops. When uvloop is available its libuv-based loop roughly doubles
+# per-message dispatch throughput; installing it here makes every loop
+# created after this import use it. Purely optional.
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 
 class AbstractDataType(ABC):
     """
@@ -1007,6 +1021,43 @@ class DatasetMetadata(AbstractDataMetadata):
         self.cumulative_daily_rows = self._get_cumulative_daily_rows()
         return None
 
+    @cached_property
+    def _hash(self) -> int:
+        """
+        Hash of the metadata computed once from its identity-defining
+        fields. Hashing the data schema reduces it to the map of data
+        types to asset tuples, mirroring the schema equality check.
+
+        Returns:
+        --------
+            int:
+                The hash of the metadata object.
+        """
+        data_schema_key = tuple(
+            (data_type, tuple(assets)) for data_type, assets in
+            self.data_schema.data_type_assets_map.items())
+        return hash((data_schema_key, self.resolution, self.calendar_type,
+                     self.start, self.end))
+
+    def __hash__(self) -> int:
+        """
+        Returns the memoized hash of the metadata. This lets callers
+        compare metadata objects with a constant-time integer check
+        instead of a field-by-field traversal of schemas and assets.
+        """
+        return self._hash
+
+    def __getstate__(self) -> Dict:
+        """
+        Returns the state of the metadata for pickling. The memoized
+        hash is dropped because string hashes are randomized per
+        interpreter process, so a persisted hash would not compare
+        against hashes computed after loading.
+        """
+        state = self.__dict__.copy()
+        state.pop('_hash', None)
+        return state
+
     @property
     def stream(self) -> StreamMetaData:
         """
@@ -1209,6 +1260,80 @@ class DatasetMetadata(AbstractDataMetadata):
         joined_metadata = super().__or__(other, start=self.start, end=self.end)
         return joined_metadata
 
+    @classmethod
+    def merge_all(
+            cls, dataset_metadata_list: List[DatasetMetadata]
+    ) -> DatasetMetadata:
+        """
+        Joins a list of metadata objects in a single pass. Reducing the
+        list pairwise with the | operator deep-copies the accumulated
+        data schema at every step, which is quadratic in the number of
+        datasets; this method copies the first schema once and extends
+        it in place, applying the same validations as the pairwise
+        join.
+
+        Args:
+        ------
+            dataset_metadata_list (List[DatasetMetadata]):
+                The metadata objects to join. Must be non-empty.
+        Returns:
+        --------
+            DatasetMetadata:
+                A new metadata object that is the result of joining all
+                metadata objects in the list.
+        Raises:
+        -------
+            ValueError:
+                If the list is empty, or if any of the metadata objects
+                disagree on start time, end time, resolution or
+                calendar type, or if assets overlap within a common
+                dataset type.
+        """
+        if not dataset_metadata_list:
+            raise ValueError('Cannot merge an empty list of metadata objects.')
+        if len(dataset_metadata_list) == 1:
+            return dataset_metadata_list[0]
+
+        first = dataset_metadata_list[0]
+        data_schema = deepcopy(first.data_schema)
+        schema = data_schema.data_type_assets_map
+
+        for other in dataset_metadata_list[1:]:
+            if first.start != other.start:
+                raise ValueError(
+                    f'Current start time: {first.start}, does not match '
+                    f'joined dataset start time {other.start}.')
+            if first.end != other.end:
+                raise ValueError(
+                    f'Current end time: {first.end}, does not match joined '
+                    f'dataset end time {other.end}.')
+            if first.resolution != other.resolution:
+                raise ValueError('Datasets must have the same resolution.')
+            if first.calendar_type != other.calendar_type:
+                raise ValueError(
+                    f'Metadata {other} has calendar type '
+                    f'{other.calendar_type} which is not compatible with '
+                    f'{first.calendar_type}.')
+
+            for data_type, other_assets in (
+                    other.data_schema.data_type_assets_map.items()):
+                if data_type in schema:
+                    assets = schema[data_type]
+                    if set(assets).intersection(set(other_assets)):
+                        raise ValueError(
+                            f'Overlap between {assets} and {other_assets} '
+                            f'in data type {data_type}')
+                    schema[data_type] += other_assets
+                else:
+                    schema[data_type] = other_assets
+
+        joined_metadata = cls(data_schema=data_schema,
+                              resolution=first.resolution,
+                              calendar_type=first.calendar_type,
+                              start=first.start,
+                              end=first.end)
+        return joined_metadata
+
     def __add__(self, other: AbstractDataMetadata) -> AbstractDataMetadata:
         """
         Appends two metadata objects. Downloading large datasets can be
@@ -1417,6 +1542,7 @@ class StaticDataFeeder(AbstractDataFeeder):
 
         self._index = None
         self._cumulative_daily_rows = (self.metadata.cumulative_daily_rows)
+        self._shared_memory = list()
         return None
 
     @property
@@ -1538,10 +1664,14 @@ class StaticDataFeeder(AbstractDataFeeder):
         iteratively returned until chunk is exhausted and next chunk is
         loaded. This is useful for loading large datasets that do not
         fit in memory or to allocate more memory for the training.
+        Chunks are read on a background thread into a single-slot
+        double buffer, so the next chunk loads from disk while the
+        current one is being consumed and at most two chunks are in
+        memory at a time.
 
         Returns:
         --------
-            Iterable[np.ndarray]: 
+            Iterable[np.ndarray]:
                 a generator object returning features corresponding to
                 each time interval as a numpy array.
         """
@@ -1552,12 +1682,161 @@ class StaticDataFeeder(AbstractDataFeeder):
                                          endpoint=True)
         self._index = self.start_index - 1
 
-        for start, end in zip(chunk_edge_indices[:-1], chunk_edge_indices[1:]):
-            joined_chunks_in_memory = np.hstack(
-                [dataset[start:end, :] for dataset in self.datasets])
-            for row in joined_chunks_in_memory:
-                self._index += 1
-                yield row
+        chunk_queue = queue.Queue(maxsize=1)
+        sentinel = object()
+        stop_event = threading.Event()
+
+        # Column extents of each dataset inside the joined feature
+        # array. HDF5 datasets are read with read_direct straight into
+        # their column slice of the joined chunk buffer, so each chunk
+        # is assembled with one full-chunk read per dataset and no
+        # intermediate per-dataset copies from hstack.
+        column_edges = np.concatenate(
+            ([0], np.cumsum([dataset.shape[1]
+                             for dataset in self.datasets])))
+
+        def produce() -> None:
+            try:
+                for start, end in zip(chunk_edge_indices[:-1],
+                                      chunk_edge_indices[1:]):
+                    if stop_event.is_set():
+                        return
+                    joined_chunk = np.empty((end - start, column_edges[-1]),
+                                            dtype=self.datasets[0].dtype)
+                    for dataset, column_start, column_end in zip(
+                            self.datasets, column_edges[:-1],
+                            column_edges[1:]):
+                        if isinstance(dataset, h5.Dataset):
+                            dataset.read_direct(
+                                joined_chunk,
+                                source_sel=np.s_[start:end, :],
+                                dest_sel=np.s_[:,
+                                               column_start:column_end])
+                        else:
+                            joined_chunk[:, column_start:
+                                         column_end] = dataset[start:end, :]
+                    chunk_queue.put(joined_chunk)
+            except BaseException as error:
+                # a read error must surface in the consumer, not end
+                # iteration early as a silently truncated dataset.
+                chunk_queue.put(error)
+            finally:
+                chunk_queue.put(sentinel)
+
+        producer = threading.Thread(target=produce, daemon=True)
+        producer.start()
+
+        try:
+            while True:
+                joined_chunks_in_memory = chunk_queue.get()
+                if joined_chunks_in_memory is sentinel:
+                    break
+                if isinstance(joined_chunks_in_memory, BaseException):
+                    raise joined_chunks_in_memory
+                for row in joined_chunks_in_memory:
+                    self._index += 1
+                    yield row
+        finally:
+            # If the generator is abandoned mid-episode (e.g. on env
+            # reset) the producer may be blocked on the full queue;
+            # signal it to stop and drain until its sentinel arrives so
+            # the thread and its chunk buffers are released instead of
+            # leaking one producer per episode.
+            stop_event.set()
+            item = None
+            while item is not sentinel and producer.is_alive():
+                try:
+                    item = chunk_queue.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+            producer.join()
+
+    def to_shared(self) -> StaticDataFeeder:
+        """
+        Materializes the underlying datasets into shared memory blocks
+        and replaces them with numpy arrays backed by those blocks.
+        Environments created from this feeder in worker processes then
+        read the same physical pages instead of each holding a private
+        copy, so resident memory stays at one dataset size regardless
+        of the number of parallel environments. The shared memory
+        blocks stay alive for the lifetime of the feeder. Calling this
+        method more than once is a no-op.
+
+        Returns:
+        --------
+            StaticDataFeeder:
+                The feeder itself, for call chaining.
+
+        Notes:
+        ------
+            This trades the chunked lazy-loading behavior for a one-time
+            full materialization of the datasets, so it should only be
+            used when the joined dataset fits in memory.
+        """
+        if self._shared_memory:
+            return self
+
+        shared_datasets = list()
+        for dataset in self.datasets:
+            nbytes = int(np.prod(dataset.shape)) * np.dtype(
+                dataset.dtype).itemsize
+            block = shared_memory.SharedMemory(create=True, size=nbytes)
+            shared_dataset = np.ndarray(dataset.shape,
+                                        dtype=dataset.dtype,
+                                        buffer=block.buf)
+            shared_dataset[...] = dataset[...]
+            shared_datasets.append(shared_dataset)
+            self._shared_memory.append(block)
+
+        self.datasets = shared_datasets
+        return self
+
+    def __getstate__(self) -> Dict:
+        """
+        Returns the state of the feeder for pickling. Shared memory
+        backed datasets are replaced by their block handles and array
+        specs, so unpickling in a worker process reattaches to the
+        existing blocks instead of copying the data over the pipe.
+        HDF5 dataset handles are not picklable and are replaced by
+        (file path, dataset name) descriptors; each worker reopens its
+        own handle, while the OS page cache deduplicates the underlying
+        file data across workers.
+        """
+        state = self.__dict__.copy()
+        if self._shared_memory:
+            state['datasets'] = [(block, dataset.shape, dataset.dtype)
+                                 for block, dataset in zip(
+                                     self._shared_memory, self.datasets)]
+            state['_shared_memory'] = list()
+        else:
+            state['datasets'] = [
+                ('__hdf5__', dataset.file.filename,
+                 dataset.name) if isinstance(dataset, h5.Dataset) else dataset
+                for dataset in self.datasets
+            ]
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        """
+        Restores the state of the feeder, rebuilding numpy views over
+        the reattached shared memory blocks when the feeder was shared,
+        and reopening per-process HDF5 handles for datasets pickled as
+        descriptors.
+        """
+        self.__dict__.update(state)
+        if self.datasets and isinstance(self.datasets[0], tuple):
+            if self.datasets[0][0] == '__hdf5__':
+                self.datasets = [
+                    h5.File(file_name, 'r', rdcc_nbytes=1 << 30)[dataset_name]
+                    for _, file_name, dataset_name in self.datasets
+                ]
+            else:
+                self._shared_memory = [block for block, _, _ in self.datasets]
+                self.datasets = [
+                    np.ndarray(shape, dtype=dtype, buffer=block.buf)
+                    for block, shape, dtype in self.datasets
+                ]
+        return None
 
     def split(self, n: int = 1 | float) -> List[StaticDataFeeder]:
         """
@@ -1635,12 +1914,34 @@ class AsyncDataFeeder(AbstractDataFeeder):
     """
     A subclass of AbstractDataFeeder that iteratively returns data
     required for the environment from an asynchronous source. This is
-    useful for loading data from a live stream.
+    useful for loading data from a live stream. Rows received from the
+    stream are staged in a bounded queue filled by background threads,
+    so fetching the next row overlaps with the consumer processing the
+    current one; when the consumer falls behind, the producers block on
+    the full queue instead of buffering without bound. Multiple data
+    clients are multiplexed by running one producer per client into
+    the shared queue, so a stalled feed delays only its own rows
+    rather than gating the others.
+
+    Attributes:
+    -----------
+        stream_metadata (StreamMetaData):
+            metadata of the stream to be fed to the environment.
+        data_client (AbstractDataClient | List[AbstractDataClient]):
+            data client, or list of data clients, used to stream data.
+        queue_size (int):
+            maximum number of staged rows. Bounds memory use and
+            provides backpressure to the stream producers.
     """
     def __init__(self, stream_metadata: StreamMetaData,
-                 data_client: AbstractDataClient) -> None:
+                 data_client: AbstractDataClient
+                 | List[AbstractDataClient],
+                 queue_size: int = 8) -> None:
         self.stream_metadata = stream_metadata
-        self.data_client = data_client
+        self.data_clients = (list(data_client) if isinstance(
+            data_client, (list, tuple)) else [data_client])
+        self.data_client = self.data_clients[0]
+        self.queue_size = queue_size
 
         return None
 
@@ -1648,9 +1949,50 @@ class AsyncDataFeeder(AbstractDataFeeder):
     def done(self):
         return False
 
-    def get_features_generator(self):
+    def stream_features(
+            self, data_client: AbstractDataClient) -> Iterable[np.ndarray]:
         """
-        Returns a generator object that can be used to iteratively
-        provide data for market environment.
+        Returns an iterable of joint feature rows read from the given
+        data client's stream. Concrete asynchronous feeders implement
+        the client-specific streaming logic here.
         """
         raise NotImplementedError
+
+    def get_features_generator(self):
+        """
+        Returns a generator object that can be used to iteratively
+        provide data for market environment. Rows are produced on one
+        background thread per data client into a shared bounded queue,
+        so network waits overlap with downstream compute and the
+        slowest feed does not set the pace for the others. The
+        generator is exhausted once every producer has finished.
+        """
+        features_queue = queue.Queue(maxsize=self.queue_size)
+        sentinel = object()
+
+        def produce(data_client: AbstractDataClient) -> None:
+            try:
+                for features in self.stream_features(data_client):
+                    features_queue.put(features)
+            except BaseException as error:
+                # a failing stream must raise in the consumer, not
+                # quietly end its feed as if it were exhausted.
+                features_queue.put(error)
+            finally:
+                features_queue.put(sentinel)
+
+        for data_client in self.data_clients:
+            producer = threading.Thread(target=produce,
+                                        args=(data_client, ),
+                                        daemon=True)
+            producer.start()
+
+        active_producers = len(self.data_clients)
+        while active_producers:
+            features = features_queue.get()
+            if features is sentinel:
+                active_producers -= 1
+                continue
+            if isinstance(features, BaseException):
+                raise features
+            yield features
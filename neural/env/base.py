@@ -330,6 +330,9 @@ class TrainMarketEnv(AbstractMarketEnv):
         self._cash = None
         self._asset_quantities = None
         self._asset_prices = None
+        self._asset_prices_view = None
+        self._price_indices = None
+        self._order_quantities = None
 
         self.features_generator = None
         self.info = None
@@ -419,28 +422,40 @@ class TrainMarketEnv(AbstractMarketEnv):
     def asset_prices(self) -> np.ndarray:
         """
         An array representing the current asset prices of the
-        environment.
-        
+        environment. The prices live in a preallocated buffer that
+        update refills in place each tick, so repeated reads within a
+        tick (positions, margin checks, order sizing) are zero-copy
+        views of the same contiguous array.
+
         Returns:
         --------
             asset_prices (np.ndarray):
                 An array representing the current asset prices of the
-                assets.
+                assets. The array is read-only; it is refreshed by the
+                environment on each update.
         """
-        asset_prices_mask = self.metadata.asset_prices_mask
-        self._asset_prices = self.features[asset_prices_mask]
-
-        return self._asset_prices
+        return self._asset_prices_view
 
     def update(self) -> None:
         """
         Updates the environment state by moving to the next time step
         and updating the environment variables such as features and
-        holds.
+        holds. Asset prices are gathered into a preallocated buffer in
+        place instead of allocating a fresh masked copy of the feature
+        vector each tick.
         """
         self.features = next(self.features_generator)
         self.holds[self.asset_quantities != 0] += 1
 
+        if self._price_indices is None:
+            self._price_indices = np.flatnonzero(
+                self.metadata.asset_prices_mask)
+            self._asset_prices = np.empty((self.n_assets, ),
+                                          dtype=GLOBAL_DATA_TYPE)
+            self._asset_prices_view = self._asset_prices.view()
+            self._asset_prices_view.setflags(write=False)
+        np.take(self.features, self._price_indices, out=self._asset_prices)
+
         return None
 
     def get_observation(self) -> Dict[str, np.ndarray[float]]:
@@ -485,15 +500,24 @@ class TrainMarketEnv(AbstractMarketEnv):
                 the asset (e.g. 100 means buy 100 dollars worth of the
                 asset, while -100 means sell 100 dollars worth of the
                 asset, given currency is USD).
-        """
-        for asset, action in enumerate(actions):
-            if action == 0:
-                continue
 
-            quantity = action / self.asset_prices[asset]
-            self._asset_quantities[asset] += quantity
-            self._cash -= action
-            self.holds[asset] = 0
+        Notes:
+        ------
+            Order sizing runs as vectorized numpy arithmetic over all
+            assets at once, writing quantities into a preallocated
+            buffer, instead of a per-asset Python loop. Step cost is a
+            handful of ufunc calls regardless of the number of assets.
+        """
+        actions = np.asarray(actions)
+        if self._order_quantities is None:
+            self._order_quantities = np.empty((self.n_assets, ),
+                                              dtype=GLOBAL_DATA_TYPE)
+        np.divide(actions, self.asset_prices, out=self._order_quantities)
+
+        traded = actions != 0
+        self._asset_quantities[traded] += self._order_quantities[traded]
+        self._cash -= actions.sum()
+        self.holds[traded] = 0
 
         return None
 
@@ -740,10 +764,13 @@ class TradeMarketEnv(TrainMarketEnv):
         is to consider the effect of slippage and  unfulfilled orders or
         other market conditions that may affect the trader's cash and
         asset quantities beyond what is simulated in the environment.
+        Advancing to a new tick invalidates the trader's per-tick
+        property cache so that account state is re-read from the API.
         """
+        self.trader._tick_cache.clear()
         super().update()
         self._cash = self.trader.cash
-        self._asset_quantities = self.trader.asset_quantities(self.assets)
+        self._asset_quantities = self.trader.asset_quantities
 
         return None
 
@@ -37,17 +37,84 @@ Examples:
     >>> model = StableBaselinesModel(...)
     >>> agent = Agent(model, pipe)
 """
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-import dill
-from typing import Optional
+import gzip
+import pickle
+from typing import ClassVar, Optional
 import os
 
 from neural.data.base import DatasetMetadata
 from neural.meta.pipe import AbstractPipe
 from neural.model.base import AbstractModel, StableBaselinesModel
 
+PICKLE_MAGIC = b'NPK5'
+DILL_MAGIC = b'NDIL'
 
-@dataclass
+
+def _dump_object(obj: object, file_path: str | os.PathLike) -> None:
+    """
+    Serializes an object to a gzip-compressed file. Objects are pickled
+    with protocol 5, which is considerably faster than dill and
+    produces fewer bytes; dill is used only as a fallback for objects
+    that the pickle module cannot handle. A four byte magic header
+    records which serializer produced the payload.
+
+    Args:
+    -------
+        obj (object):
+            The object to serialize.
+        file_path (str | os.PathLike):
+            The path of the file to write the object to.
+    """
+    try:
+        magic = PICKLE_MAGIC
+        serialized = pickle.dumps(obj, protocol=5)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        import dill
+        magic = DILL_MAGIC
+        serialized = dill.dumps(obj)
+
+    with open(file_path, 'wb', buffering=1 << 20) as file:
+        file.write(magic)
+        with gzip.GzipFile(fileobj=file, mode='wb', compresslevel=3) as gzipped:
+            gzipped.write(serialized)
+
+    return None
+
+
+def _load_object(file_path: str | os.PathLike) -> object:
+    """
+    Deserializes an object written by _dump_object. Files produced
+    before the magic header was introduced are raw dill payloads and
+    are still loaded transparently.
+
+    Args:
+    -------
+        file_path (str | os.PathLike):
+            The path of the file to load the object from.
+
+    Returns:
+    --------
+        object: The deserialized object.
+    """
+    with open(file_path, 'rb', buffering=1 << 20) as file:
+        magic = file.read(4)
+
+        if magic == PICKLE_MAGIC:
+            with gzip.GzipFile(fileobj=file, mode='rb') as gzipped:
+                return pickle.loads(gzipped.read())
+
+        import dill
+        if magic == DILL_MAGIC:
+            with gzip.GzipFile(fileobj=file, mode='rb') as gzipped:
+                return dill.loads(gzipped.read())
+
+        file.seek(0)
+        return dill.load(file)
+
+
+@dataclass(slots=True)
 class Agent:
     """
     A reinforcement learning agent. This is a self-contained entity that
@@ -73,9 +140,9 @@ class Agent:
     pipe: AbstractPipe
     dataset_metadata: Optional[DatasetMetadata] = None
 
-    MODEL_SAVE_DIR_NAME = 'model'
-    PIPE_SAVE_FILE_NAME = 'pipe'
-    DATASET_METADATA_SAVE_FILE_NAME = 'dataset_metadata'
+    MODEL_SAVE_DIR_NAME: ClassVar[str] = 'model'
+    PIPE_SAVE_FILE_NAME: ClassVar[str] = 'pipe'
+    DATASET_METADATA_SAVE_FILE_NAME: ClassVar[str] = 'dataset_metadata'
 
     def save(self, dir: str | os.PathLike):
         """
@@ -93,24 +160,33 @@ class Agent:
             file_path (str | os.PathLike):
                 The path to the tarfile to save the agent to.
         """
-        os.makedirs(dir, exist_ok=True)
-
-        with open(os.path.join(dir, self.PIPE_SAVE_FILE_NAME), 'wb') as pipe_file:
-            dill.dump(self.pipe, pipe_file)
-
-        with open(os.path.join(dir, self.DATASET_METADATA_SAVE_FILE_NAME),
-                  'wb') as dataset_metadata_file:
-            dill.dump(self.dataset_metadata, dataset_metadata_file)
-
+        # makedirs is recursive, so creating the model subdirectory
+        # also creates the checkpoint directory in a single call.
         model_dir = os.path.join(dir, self.MODEL_SAVE_DIR_NAME)
         os.makedirs(model_dir, exist_ok=True)
-        self.model.save(model_dir)
+
+        # The three artifacts are independent; writing them on separate
+        # threads lets file I/O (which releases the GIL) overlap with
+        # serialization instead of running the chains back to back.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(_dump_object, self.pipe,
+                                os.path.join(dir, self.PIPE_SAVE_FILE_NAME)),
+                executor.submit(
+                    _dump_object, self.dataset_metadata,
+                    os.path.join(dir, self.DATASET_METADATA_SAVE_FILE_NAME)),
+                executor.submit(self.model.save, model_dir),
+            ]
+            for future in futures:
+                future.result()
 
     @classmethod
     def load(
         cls,
         dir: str | os.PathLike,
-    ) -> Agent:
+        precision: Optional[str] = None,
+        backend: str = 'torch',
+    ) -> 'Agent':
         """
         Loads an agent from a directory. The directory should have the
         following structure:
@@ -125,6 +201,16 @@ class Agent:
         -------
             dir (str | os.PathLike):
                 directory to load the agent from.
+            precision (Optional[str]):
+                If provided, the loaded model is quantized to this
+                precision ('int8' or 'bf16') for inference. Training
+                should load with the default of None to stay in full
+                precision.
+            backend (str):
+                The inference backend, 'torch' (default) or 'onnx'.
+                The 'onnx' backend runs the deterministic policy graph
+                exported at save time through onnxruntime, trading
+                trainability for lower-variance per-step latency.
         Returns:
         --------
             model (AbstractModel):
@@ -139,24 +225,38 @@ class Agent:
             >>> from neural.meta.agent import Agent
             >>> agent = Agent.load(...)
         """
-        with open(os.path.join(dir, 'pipe'), 'rb') as pipe_file:
-            pipe = dill.load(pipe_file)
-
-        with open(os.path.join(dir, 'dataset_metadata'),
-                  'rb') as dataset_metadata_file:
-            dataset_metadata = dill.load(dataset_metadata_file)
+        model_dir = os.path.join(dir, cls.MODEL_SAVE_DIR_NAME)
 
-        model_dir = os.path.join(dir, 'model')
-        model_class = cls._get_model_class(model_dir)
-        model = model_class.load(model_dir)
+        # The three artifacts load independently; running them on
+        # separate threads overlaps file reads with deserialization,
+        # mirroring the write-side concurrency in save.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            pipe_future = executor.submit(
+                _load_object, os.path.join(dir, cls.PIPE_SAVE_FILE_NAME))
+            dataset_metadata_future = executor.submit(
+                _load_object,
+                os.path.join(dir, cls.DATASET_METADATA_SAVE_FILE_NAME))
+            model_future = executor.submit(
+                lambda: cls._get_model_class(model_dir).load(model_dir))
 
-        return Agent(model=model, pipe=pipe, dataset_metadata=dataset_metadata)
+            model = model_future.result()
+            if precision is not None:
+                model.quantize(precision)
+            if backend == 'onnx':
+                model.enable_onnx_backend(model_dir)
+            elif backend != 'torch':
+                raise ValueError(f"Unsupported backend: {backend}. "
+                                 f"Supported options: 'torch', 'onnx'.")
+            return Agent(model=model,
+                         pipe=pipe_future.result(),
+                         dataset_metadata=dataset_metadata_future.result())
 
     @classmethod
     def _get_model_class(cls, model_dir: str | os.PathLike) -> AbstractModel:
         file_name_to_model_class = {
             StableBaselinesModel.MODEL_SAVE_FILE_NAME: StableBaselinesModel}
+        file_names = {entry.name for entry in os.scandir(model_dir)}
         for file_name, model_class in file_name_to_model_class.items():
-            if os.path.exists(os.path.join(model_dir, file_name)):
+            if file_name in file_names:
                 return model_class
         raise ValueError(f"Could not find a model file in {model_dir}.")
@@ -79,9 +79,12 @@ Classes:
             - render pipe
 """
 from abc import abstractmethod, ABC
+import copy
+from functools import partial
 from typing import Callable
 
-from gym import Env
+from gym import (ActionWrapper, Env, ObservationWrapper, RewardWrapper,
+                 Wrapper)
 
 from neural.env.base import AbstractMarketEnv
 from neural.wrapper.action import (
@@ -177,6 +180,144 @@ class AbstractPipe(ABC):
                     f'{AbstractMarketEnvMetadataWrapper.__name__}.')
         return env
 
+    # Attribute names holding lazily built live objects. They are
+    # excluded from serialization and rebuilt on first use after
+    # loading, so checkpoints carry configuration only.
+    _TRANSIENT_STATE = ('_wrapper_chain', )
+
+    def __getstate__(self):
+        """
+        Serializes only the configuration of the pipe. Lazily built
+        state such as the wrapper chain is a graph of live objects
+        whose traversal dominates pickling time and blob size; it is
+        dropped here and rebuilt on demand after loading.
+
+        Returns:
+        --------
+            state (dict):
+                The instance dictionary minus transient attributes.
+        """
+        state = self.__dict__.copy()
+        for key in self._TRANSIENT_STATE:
+            state.pop(key, None)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores a pipe from its serialized configuration, resetting
+        transient attributes so they are rebuilt on first use.
+
+        Args:
+        -----
+            state (dict):
+                The serialized instance dictionary.
+        """
+        self.__dict__.update(state)
+        for key in self._TRANSIENT_STATE:
+            self.__dict__.setdefault(key, None)
+        return None
+
+    def clone(self) -> 'AbstractPipe':
+        """
+        Returns an independent copy of the pipe rebuilt from its
+        configuration. Unlike copy.deepcopy on the full instance, this
+        never traverses lazily built wrapper graphs (excluded by
+        __getstate__), so cloning stays cheap regardless of pipe size
+        and the clones pickle cleanly across process boundaries when
+        used with parallel environments.
+
+        Returns:
+        --------
+            clone (AbstractPipe):
+                A pipe of the same type with an independent copy of
+                the configuration and freshly reset transient state.
+        """
+        clone = type(self).__new__(type(self))
+        clone.__setstate__(copy.deepcopy(self.__getstate__()))
+        return clone
+
+    @staticmethod
+    def fuse_step(env: Env) -> Env:
+        """
+        Fuses every run of consecutive pure action/observation/reward
+        wrappers in the chain into a single step function bound on the
+        outermost wrapper of that run. Every wrapper layer otherwise
+        costs one Python call frame plus an attribute lookup per step.
+        Only wrappers that inherit the default gym ActionWrapper/
+        ObservationWrapper/RewardWrapper step are fused; a wrapper with
+        a custom step keeps its own behavior and delimits the fused
+        runs, so pure layers buried under e.g. the render wrapper are
+        still collapsed.
+
+        Args:
+        -----
+            env (Env):
+                fully wrapped environment.
+
+        Returns:
+        --------
+            env (Env):
+                the same environment, with the step of each fused run's
+                outermost wrapper rebound to the fused function.
+        """
+
+        def fuse_run(run_wrappers, action_transforms, observation_transforms,
+                     reward_transforms, below):
+            n_fused = (len(action_transforms) + len(observation_transforms) +
+                       len(reward_transforms))
+            if n_fused < 2:
+                return
+            # the wrapper below a run is never itself rebound (only run
+            # tops are), so its bound step can be captured directly.
+            base_step = below.step
+            observation_transforms = list(reversed(observation_transforms))
+            reward_transforms = list(reversed(reward_transforms))
+
+            def fused_step(action):
+                for transform in action_transforms:
+                    action = transform(action)
+                observation, reward, done, info = base_step(action)
+                for transform in reward_transforms:
+                    reward = transform(reward)
+                for transform in observation_transforms:
+                    observation = transform(observation)
+                return observation, reward, done, info
+
+            # the layer above the run calls self.env.step, which finds
+            # the fused function on the run's outermost wrapper.
+            run_wrappers[0].step = fused_step
+
+        action_transforms = list()
+        observation_transforms = list()
+        reward_transforms = list()
+        run_wrappers = list()
+
+        current = env
+        while isinstance(current, Wrapper):
+            step = type(current).step
+            if step is ActionWrapper.step:
+                run_wrappers.append(current)
+                action_transforms.append(current.action)
+            elif step is ObservationWrapper.step:
+                run_wrappers.append(current)
+                observation_transforms.append(current.observation)
+            elif step is RewardWrapper.step:
+                run_wrappers.append(current)
+                reward_transforms.append(current.reward)
+            else:
+                # a custom step ends the current run; fuse what was
+                # collected above this wrapper and start a new run.
+                fuse_run(run_wrappers, action_transforms,
+                         observation_transforms, reward_transforms, current)
+                action_transforms = list()
+                observation_transforms = list()
+                reward_transforms = list()
+                run_wrappers = list()
+            current = current.env
+        fuse_run(run_wrappers, action_transforms, observation_transforms,
+                 reward_transforms, current)
+        return env
+
     @abstractmethod
     def pipe(self, env: Env) -> Env:
         """
@@ -486,13 +627,14 @@ class ActionPipe(AbstractPipe):
         
         Attributes:
         -----------
-        min_trade_threshold (MinTradeSizeActionWrapper):    
-            minimum trade size wrapper. Set to MinTradeSizeActionWrapper at
+        min_trade_size (MinTradeSizeActionWrapper):
+            minimum trade size wrapper with the minimum trade size
+            pre-bound. Set to MinTradeSizeActionWrapper at
             construction.
         integer_quantity (IntegerAssetQuantityActionWrapper):
             integer asset quantity wrapper. Set to
             IntegerAssetQuantityActionWrapper at construction.
-        position_close (PositionCloseActionWrapper):    
+        position_close (PositionCloseActionWrapper):
             position close wrapper. Set to PositionCloseActionWrapper at
             construction.
         shorting (ShortingActionWrapper):
@@ -502,7 +644,8 @@ class ActionPipe(AbstractPipe):
         self.min_trade_threshold = min_trade
         self.integer = integer
 
-        self.min_trade_threshold = MinTradeSizeActionWrapper
+        self.min_trade_size = partial(MinTradeSizeActionWrapper,
+                                      min_trade=min_trade)
         self.integer_quantity = IntegerAssetQuantityActionWrapper
         self.position_close = PositionCloseActionWrapper
         self.shorting = ShortingActionWrapper
@@ -530,7 +673,7 @@ class ActionPipe(AbstractPipe):
             env (gym.Env):
                 wrapped environment
         """
-        env = self.min_trade_threshold(env, min_trade=self.min_trade_threshold)
+        env = self.min_trade_size(env)
         env = self.integer_quantity(env, integer=self.integer)
         env = self.position_close(env)
         env = self.shorting(env)
@@ -1187,9 +1330,49 @@ class MarginAccountPipe(BasePipe):
         self.excess_margin = ExcessMarginActionWrapper
 
         self.base_pipe = BasePipe
+        self._wrapper_chain = None
 
         return None
 
+    def _build_wrapper_chain(self):
+        """
+        Builds the flat list of wrapper factories applied by pipe. The
+        chain is computed once and cached so that repeated calls to
+        pipe (one per environment) only pay for wrapper construction,
+        not for re-deriving the chain or re-instantiating the base
+        pipe.
+
+        Returns:
+        ---------
+        wrapper_chain (list):
+            callables applied successively to the environment.
+        """
+        base_pipe = self.base_pipe(verbosity=self.verbosity,
+                                   interest_rate=self.interest_rate,
+                                   buffer_size=self.buffer_size,
+                                   stack_size=self.stack_size,
+                                   min_trade=self.min_trade_threshold,
+                                   integer=self.integer,
+                                   uniform=self.uniform,
+                                   fixed=self.fixed,
+                                   discrete=self.discrete,
+                                   trade_equity_ratio=self.trade_equity_ratio,
+                                   hold_threshold=self.hold_threshold,
+                                   clip=self.clip,
+                                   low=self.low,
+                                   high=self.high)
+
+        wrapper_chain = [
+            self.margin_account_metadata,
+            self.initial_margin,
+            partial(self.excess_margin,
+                    excess_margin_ratio_threshold=self.
+                    excess_margin_ratio_threshold),
+            base_pipe.pipe,
+        ]
+
+        return wrapper_chain
+
     def pipe(self, env):
         """
         Applies a stack of market wrappers successively to an
@@ -1197,33 +1380,19 @@ class MarginAccountPipe(BasePipe):
 
         Args:
         ------
-        env (AbstractMarketEnv): 
+        env (AbstractMarketEnv):
             the environment to be wrapped.
 
         Returns:
         ---------
-        env (gym.Env): 
+        env (gym.Env):
             the wrapped environment.
         """
 
-        env = self.margin_account_metadata(env)
-        env = self.initial_margin(env)
-        env = self.excess_margin(
-            env,
-            excess_margin_ratio_threshold=self.excess_margin_ratio_threshold)
-        env = self.base_pipe(verbosity=self.verbosity,
-                             interest_rate=self.interest_rate,
-                             buffer_size=self.buffer_size,
-                             stack_size=self.stack_size,
-                             min_trade=self.min_trade_threshold,
-                             integer=self.integer,
-                             uniform=self.uniform,
-                             fixed=self.fixed,
-                             discrete=self.discrete,
-                             trade_equity_ratio=self.trade_equity_ratio,
-                             hold_threshold=self.hold_threshold,
-                             clip=self.clip,
-                             low=self.low,
-                             high=self.high).pipe(env)
+        if self._wrapper_chain is None:
+            self._wrapper_chain = self._build_wrapper_chain()
 
-        return env
+        for wrap in self._wrapper_chain:
+            env = wrap(env)
+
+        return self.fuse_step(env)
@@ -13,8 +13,27 @@ from torch import nn
 from stable_baselines3.common.on_policy_algorithm import OnPolicyAlgorithm
 from stable_baselines3 import PPO, A2C, DQN, SAC, TD3, DDPG
 
+from neural.common.log import logger
 from neural.env.base import TrainMarketEnv
 
+
+class _DeterministicPolicy(nn.Module):
+    """
+    Thin module exposing the deterministic action path of a
+    stable-baselines policy as a plain forward, as required for ONNX
+    export. The raw policy forward samples from the action
+    distribution, which neither traces cleanly nor matches inference
+    semantics.
+    """
+
+    def __init__(self, policy: nn.Module):
+        super().__init__()
+        self.policy = policy
+
+    def forward(self, observation):
+        return self.policy._predict(observation, deterministic=True)
+
+
 class AbstractModel:
     """
     This is the base class for all models.
@@ -98,6 +117,7 @@ class StableBaselinesModel(AbstractModel):
 
     MODEL_SAVE_FILE_NAME = 'model'
     BASE_MODEL_SAVE_FILE_NAME = 'stable_baselines3_model'
+    ONNX_SAVE_FILE_NAME = 'model.onnx'
 
     def __init__(self, algorithm: str = 'ppo', policy: str | nn.Module = 'MlpPolicy'):
 
@@ -105,14 +125,109 @@ class StableBaselinesModel(AbstractModel):
         self.algorithm = self._get_algorithm(algorithm)
         self.policy = policy
         self.base_model = None
+        self._inference_optimized = False
+        self._obs_host = None
+        self._obs_host_np = None
+        self._onnx_session = None
 
     def __call__(self, observation) -> np.ndarray[float]:
+        if self._onnx_session is not None:
+            observation = np.asarray(observation, dtype=np.float32)
+            actions = self._onnx_session.run(
+                None, {'obs': observation[None]})[0]
+            return np.squeeze(actions, axis=0)
         if self.base_model is None:
             raise RuntimeError("Model is not trained yet.")
         with torch.no_grad(), torch.set_grad_enabled(False):
+            observation = self._stage_observation(observation)
             actions = self.base_model.predict(observation)
             return actions
 
+    def _stage_observation(self, observation):
+        """
+        Stages a fixed-shape numpy observation through a reusable
+        pinned-memory host buffer when inference runs on CUDA. The
+        buffer's numpy view is handed to predict, so the tensor built
+        from it shares pinned memory and the host-to-device copy is
+        performed from page-locked memory instead of a freshly
+        allocated pageable array each tick. Falls through unchanged on
+        CPU-only builds or non-array observations.
+        """
+        if not torch.cuda.is_available() or not isinstance(
+                observation, np.ndarray):
+            return observation
+
+        if (self._obs_host is None
+                or self._obs_host_np.shape != observation.shape
+                or self._obs_host_np.dtype != observation.dtype):
+            self._obs_host = torch.as_tensor(observation).pin_memory()
+            self._obs_host_np = self._obs_host.numpy()
+        else:
+            np.copyto(self._obs_host_np, observation)
+        return self._obs_host_np
+
+    def optimize_for_inference(self) -> None:
+        """
+        Compiles the policy network for the repeated single-observation
+        inference pattern of the trading loop. Eager-mode dispatch
+        overhead dominates small per-tick forward passes; compiling the
+        policy with torch.compile in reduce-overhead mode fuses the
+        forward graph. The first call after compilation is slow while
+        the graph is traced, so callers should run one warm-up forward
+        before entering a latency-sensitive loop. Idempotent, and a
+        no-op on torch builds without the compiler.
+        """
+        if self.base_model is None:
+            raise RuntimeError("Model is not trained yet.")
+        if getattr(self, '_inference_optimized', False):
+            return None
+
+        if hasattr(torch, 'compile'):
+            self.base_model.policy = torch.compile(self.base_model.policy,
+                                                   mode='reduce-overhead')
+        self._inference_optimized = True
+
+        return None
+
+    def quantize(self, precision: str) -> None:
+        """
+        Reduces the numeric precision of the policy network for
+        inference. The policy is small and the trading path needs no
+        gradients, so lower precision trades negligible accuracy for
+        lower per-step latency and weight bandwidth. Options for
+        precision are:
+            - 'int8':
+                Dynamic int8 quantization of linear and LSTM layers,
+                for CPU deployments.
+            - 'bf16':
+                Casts the policy to bfloat16, for GPU deployments with
+                tensor core support (falls back to a CPU cast when no
+                GPU is present).
+
+        Args:
+        ----------
+            precision (str):
+                The target precision, 'int8' or 'bf16'.
+        """
+        if self.base_model is None:
+            raise RuntimeError("Model is not trained yet.")
+
+        policy = self.base_model.policy
+        policy.eval()
+        if precision == 'int8':
+            self.base_model.policy = torch.ao.quantization.quantize_dynamic(
+                policy, {nn.Linear, nn.LSTM}, dtype=torch.qint8)
+        elif precision == 'bf16':
+            if torch.cuda.is_available():
+                self.base_model.policy = policy.to(dtype=torch.bfloat16,
+                                                   device='cuda')
+            else:
+                self.base_model.policy = policy.to(dtype=torch.bfloat16)
+        else:
+            raise ValueError(f"Unsupported precision: {precision}. "
+                             f"Supported options: 'int8', 'bf16'.")
+        return None
+
     def _get_algorithm(self, algorithm_name: str) -> OnPolicyAlgorithm:
         algorithm_class = self.ALGORITHMS.get(algorithm_name.lower())
         if algorithm_class is None:
@@ -126,7 +241,56 @@ class StableBaselinesModel(AbstractModel):
         with open(os.path.join(dir, self.MODEL_SAVE_FILE_NAME), 'wb') as model_file:
             model_copy = copy(self)
             del model_copy.base_model
+            model_copy._inference_optimized = False
+            model_copy._obs_host = None
+            model_copy._obs_host_np = None
+            model_copy._onnx_session = None
             dill.dump(model_copy, model_file)
+        self._export_onnx(dir)
+        return None
+
+    def _export_onnx(self, dir: str | os.PathLike) -> None:
+        """
+        Best-effort export of the deterministic policy to ONNX
+        alongside the checkpoint, enabling graph-runtime inference via
+        enable_onnx_backend. Export failure (e.g. an architecture the
+        tracer cannot handle) only forfeits the optional backend, so
+        it is logged and swallowed rather than failing the save.
+        """
+        try:
+            observation = self.base_model.observation_space.sample()
+            dummy_observation = torch.as_tensor(observation[None])
+            torch.onnx.export(
+                _DeterministicPolicy(self.base_model.policy),
+                dummy_observation,
+                os.path.join(dir, self.ONNX_SAVE_FILE_NAME),
+                opset_version=17,
+                input_names=['obs'],
+                output_names=['actions'],
+                dynamic_axes={'obs': {0: 'batch'}},
+            )
+        except Exception as onnx_export_error:
+            logger.warning('ONNX export skipped: %s', onnx_export_error)
+        return None
+
+    def enable_onnx_backend(self, dir: str | os.PathLike) -> None:
+        """
+        Switches inference to the ONNX graph exported at save time.
+        The graph executor removes Python dispatch from the forward
+        pass, giving lower and less variable per-step latency than
+        eager execution. Requires the optional onnxruntime package and
+        an ONNX file in the checkpoint directory; actions are produced
+        deterministically.
+
+        Args:
+        ----------
+            dir (str | os.PathLike):
+                The checkpoint directory containing the ONNX file.
+        """
+        import onnxruntime as ort
+        self._onnx_session = ort.InferenceSession(
+            os.path.join(dir, self.ONNX_SAVE_FILE_NAME),
+            providers=['CPUExecutionProvider'])
         return None
 
     @classmethod
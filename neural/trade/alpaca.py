@@ -135,6 +135,7 @@ class AlpacaTrader(AbstractTrader):
         TradeConstraintViolationError:
             If return on equity is below threshold.
     """
+    __slots__ = ()
 
     def __init__(self, trade_client: AlpacaTradeClient,
                  data_client: AlpacaDataClient, agent: Agent) -> None:
@@ -244,24 +245,36 @@ class AlpacaTrader(AbstractTrader):
         """
         self.check_constraints()
 
-        for action, asset, price, quantity in zip(actions, self.assets,
-                                                  self.asset_prices,
-                                                  self.asset_quantities):
-            new_quantity = round(action / price, quantity_precision)
+        assets = self.assets
+        prices = self.asset_prices
+        quantities = self.asset_quantities
 
-            if not asset.fractionable:
-                new_quantity = int(new_quantity)
-            if not asset.shortable:
-                if quantity == 0 and new_quantity < 0:
-                    new_quantity = 0
-            if quantity <= 0 and new_quantity < 0:
-                new_quantity = int(new_quantity)
-            if (quantity > 0 and quantity + new_quantity < 0
-                    or quantity < 0 and quantity + new_quantity > 0):
-                new_quantity = quantity
+        # The quantity work buffer is allocated once and updated in
+        # place, so steady-state order sizing performs no full-size
+        # array allocations.
+        if self._action_buffer is None:
+            self._action_buffer = np.empty((len(assets), ), dtype=float)
+        new_quantities = self._action_buffer
+        np.divide(actions, prices, out=new_quantities)
+        np.round(new_quantities, quantity_precision, out=new_quantities)
 
-            self.trade_client.place_order(
-                asset=asset,
-                quantity=new_quantity,
-                time_in_force='ioc',
-            )
+        truncate = (~self._fractionable_np
+                    | ((quantities <= 0) & (new_quantities < 0)))
+        new_quantities[truncate] = np.trunc(new_quantities[truncate])
+        new_quantities[~self._shortable_np & (quantities == 0)
+                       & (new_quantities < 0)] = 0
+        position_flips = ((quantities > 0)
+                          & (quantities + new_quantities < 0)
+                          | (quantities < 0)
+                          & (quantities + new_quantities > 0))
+        new_quantities[position_flips] = quantities[position_flips]
+
+        orders = [
+            dict(asset=assets[index],
+                 quantity=new_quantities[index].item(),
+                 time_in_force='ioc')
+            for index in np.flatnonzero(new_quantities != 0)
+        ]
+        # A single batched submission replaces N sequential round
+        # trips; zero-quantity actions are filtered before dispatch.
+        self.trade_client.place_orders(orders)
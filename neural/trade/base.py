@@ -27,12 +27,14 @@ Class(es):
         orders using a trading client and a model to produce actions.
 """
 from abc import ABC
-from datetime import datetime, timedelta
-from typing import List
+import time
+from typing import List, TYPE_CHECKING
 
 import numpy as np
 import pandas as pd
-from torch import nn
+
+if TYPE_CHECKING:
+    from torch import nn
 
 from neural.client.alpaca import AbstractTradeClient, AbstractDataClient
 from neural.common.log import logger
@@ -122,6 +124,30 @@ class AbstractTrader(ABC):
             Abstract method for placing an order for a single asset. The
             restrictions of the API should be enforced in this method.
     """
+    # A fixed attribute set lets instances drop __dict__: attribute
+    # reads in the per-tick loop become direct slot offsets instead of
+    # dict probes. Subclasses adding state must declare __slots__ too.
+    __slots__ = (
+        'trade_client',
+        'data_client',
+        'agent',
+        '_data_feeder',
+        '_trade_market_env',
+        '_market_metadata_wrapper',
+        '_model',
+        'handle_non_trade_time',
+        '_schedule_ns',
+        '_trading_window_ns',
+        '_next_schedule_check',
+        '_schedule',
+        '_tick_cache',
+        '_assets',
+        '_symbols_np',
+        '_fractionable_np',
+        '_shortable_np',
+        '_action_buffer',
+    )
+
     def __init__(self, trade_client: AbstractTradeClient,
                  data_client: AbstractDataClient, agent: Agent) -> None:
         """
@@ -143,9 +169,23 @@ class AbstractTrader(ABC):
 
         self._data_feeder = None
         self._trade_market_env = None
+        self._market_metadata_wrapper = None
         self._model = None
         self.handle_non_trade_time = False
 
+        self._schedule_ns = None
+        self._trading_window_ns = None
+        self._next_schedule_check = 0.0
+
+        self._schedule = None
+        self._tick_cache = dict()
+
+        self._assets = None
+        self._symbols_np = None
+        self._fractionable_np = None
+        self._shortable_np = None
+        self._action_buffer = None
+
         return None
 
     @property
@@ -182,7 +222,10 @@ class AbstractTrader(ABC):
     @property
     def market_metadata_wrapper(self) -> AbstractMarketEnvMetadataWrapper:
         """
-        The metadata wrapper used by the trading environment.
+        The metadata wrapper used by the trading environment. Resolved
+        once and cached: the resolution walks the wrapper chain, and
+        this property sits under every per-tick read of schedule,
+        assets and asset prices.
 
         Returns:
         --------
@@ -190,35 +233,54 @@ class AbstractTrader(ABC):
                 An instance of the metadata wrapper used by the
                 trading environment.
         """
-        market_metadata_wrapper = self.agent.pipe.get_market_metadata_wrapper(
-            self.trade_market_env)
-        return market_metadata_wrapper
+        if self._market_metadata_wrapper is None:
+            self._market_metadata_wrapper = (
+                self.agent.pipe.get_market_metadata_wrapper(
+                    self.trade_market_env))
+        return self._market_metadata_wrapper
 
     @property
     def schedule(self) -> pd.DataFrame:
         """
         The schedule of the trading environment. The schedule is a list
         of datetime objects representing the times at which the
-        environment is reset.
+        environment is reset. Cached permanently since it only changes
+        when the market calendar is reloaded.
 
         Returns:
         --------
             schedule (List[datetime]):
                 The schedule of the trading environment.
         """
-        return self.market_metadata_wrapper.schedule
+        if self._schedule is None:
+            self._schedule = self.market_metadata_wrapper.schedule
+        return self._schedule
 
     @property
     def assets(self) -> List[AlpacaAsset]:
         """
-        A numpy array of assets held by the trader.
+        A numpy array of assets held by the trader. The asset universe
+        is fixed for the lifetime of the trader, so on first access the
+        per-asset attributes needed in the order-placing hot path are
+        unpacked once into parallel structure-of-arrays numpy buffers
+        (_symbols_np, _fractionable_np, _shortable_np). This lets
+        place_orders operate on vectorized masks instead of
+        dereferencing asset objects per tick.
 
         Returns:
         --------
             assets (List[AlpacaAsset]):
                 The assets held by the trader.
         """
-        return self.market_metadata_wrapper.assets
+        if self._assets is None:
+            self._assets = self.market_metadata_wrapper.assets
+            self._symbols_np = np.asarray(
+                [asset.symbol for asset in self._assets], dtype=object)
+            self._fractionable_np = np.asarray(
+                [asset.fractionable for asset in self._assets], dtype=bool)
+            self._shortable_np = np.asarray(
+                [bool(asset.shortable) for asset in self._assets], dtype=bool)
+        return self._assets
 
     @property
     def cash(self) -> float:
@@ -247,7 +309,11 @@ class AbstractTrader(ABC):
             asset_quantities (np.ndarray[float]):
                 The current quantity of each asset held by the trader.
         """
-        return self.trade_client.get_asset_quantities(assets=self.assets)
+        if 'asset_quantities' not in self._tick_cache:
+            self._tick_cache[
+                'asset_quantities'] = self.trade_client.get_asset_quantities(
+                    assets=self.assets)
+        return self._tick_cache['asset_quantities']
 
     @property
     def asset_prices(self) -> np.ndarray[float]:
@@ -260,10 +326,13 @@ class AbstractTrader(ABC):
             asset_prices (np.ndarray[float]):
                 The current price of each asset held by the trader.
         """
-        return self.market_metadata_wrapper.asset_prices
+        if 'asset_prices' not in self._tick_cache:
+            self._tick_cache[
+                'asset_prices'] = self.market_metadata_wrapper.asset_prices
+        return self._tick_cache['asset_prices']
 
     @property
-    def model(self) -> nn.Module:
+    def model(self) -> 'nn.Module':
         """
         Returns the model used by the agent to generate actions.
 
@@ -274,30 +343,68 @@ class AbstractTrader(ABC):
         """
         return self.agent.model
 
+    def _resolve_trading_window(self, now_ns: int) -> None:
+        """
+        Resolves the trading window (session start/end) that the
+        current time falls in or precedes, as integer UTC nanosecond
+        bounds, and caches it. The full schedule is converted once on
+        first use to an int64 (n_days, 2) bounds array - timezone
+        conversion to UTC happens at that point, so the lookup itself
+        is a binary search over plain integers. Afterwards this method
+        only runs when the cached window is exhausted, namely once per
+        trading day.
+
+        Args:
+        ------
+            now_ns (int):
+                The current UTC time in nanoseconds since the epoch.
+
+        Raises:
+        -------
+            ValueError:
+                If the current time is past the end of the schedule.
+        """
+        if self._schedule_ns is None:
+            schedule = self.schedule
+            starts_ns = np.asarray(schedule['start'].values,
+                                   dtype='datetime64[ns]').astype(np.int64)
+            ends_ns = np.asarray(schedule['end'].values,
+                                 dtype='datetime64[ns]').astype(np.int64)
+            self._schedule_ns = np.stack([starts_ns, ends_ns], axis=1)
+
+        index = int(
+            np.searchsorted(self._schedule_ns[:, 1], now_ns, side='left'))
+        if index == len(self._schedule_ns):
+            raise ValueError('Current time is past the end of the '
+                             'trading schedule.')
+        self._trading_window_ns = (int(self._schedule_ns[index, 0]),
+                                   int(self._schedule_ns[index, 1]))
+        return None
+
     def _check_time(self) -> bool:
         """
         A method to check if the current time is within the trading
         schedule. If the current time is not within the trading
-        schedule, then all open orders are cancelled.
+        schedule, then all open orders are cancelled. The schedule is
+        cached as integer nanosecond bounds so the per-tick check is a
+        pair of integer comparisons instead of a pandas label lookup.
 
         Returns:
         --------
             bool:
                 True if the current time is within the trading schedule,
         """
-        current_time = datetime.utcnow().date()
-        current_day = current_time.date()
-        start, end = self.schedule.loc[current_day].values()
+        now_ns = time.time_ns()
+        if (self._trading_window_ns is None
+                or now_ns > self._trading_window_ns[1]):
+            self._resolve_trading_window(now_ns)
+        start_ns, end_ns = self._trading_window_ns
 
-        if not start <= current_time <= end:
+        if not start_ns <= now_ns <= end_ns:
             if self.handle_non_trade_time:
                 self.trade_client.cancel_all_orders()
-                if current_time < start:
-                    logger.log(f'Waiting for market to open at {start}.')
-                elif current_time > end:
-                    next_day = current_day + timedelta(days=1)
-                    next_start = self.schedule.loc[next_day]['start']
-                    logger.log(f'Waiting for market to open at {next_start}.')
+                logger.info('Waiting for market to open at %s.',
+                            pd.Timestamp(start_ns, unit='ns', tz='UTC'))
                 self.handle_non_trade_time = False
             return False
         self.handle_non_trade_time = True
@@ -311,19 +418,48 @@ class AbstractTrader(ABC):
         logger.info('Initiating trading process.')
         self.trade_client.check_connection()
         model = self.model
+        if hasattr(model, 'optimize_for_inference'):
+            model.optimize_for_inference()
 
         while True:
             if self._check_time():
                 break
-
-        observation = self.trade_market_env.reset()
+            # _check_time has cached the bounds of the upcoming
+            # session; sleeping until it opens (re-checking at least
+            # once a minute) keeps the core idle instead of spinning.
+            start_ns, _ = self._trading_window_ns
+            wait_seconds = max((start_ns - time.time_ns()) / 1e9, 0.0)
+            time.sleep(min(wait_seconds, 60.0))
+
+        # Resolving the environment and binding step once keeps the
+        # property descriptor and attribute lookups out of the loop.
+        env = self.trade_market_env
+        step = env.step
+        observation = env.reset()
+        # Warm-up forward pass absorbs compilation latency outside the
+        # order-placing loop.
+        model(observation)
         while True:
-            if self._check_time():
-                action = model(observation)
-                observation, reward, done, info = (
-                    self.trade_market_env.step(action))
-                if done:
-                    break
+            # The schedule check is re-verified every 30 seconds of
+            # wall-clock time rather than every tick; market close is
+            # still detected within that window.
+            now = time.monotonic()
+            if now >= self._next_schedule_check:
+                if not self._check_time():
+                    # market just closed; _check_time has resolved the
+                    # upcoming session, so sleep toward its open
+                    # (re-checking at least once a minute) instead of
+                    # spinning on the schedule check until it opens.
+                    start_ns, _ = self._trading_window_ns
+                    wait_seconds = max(
+                        (start_ns - time.time_ns()) / 1e9, 0.0)
+                    time.sleep(min(wait_seconds, 60.0))
+                    continue
+                self._next_schedule_check = now + 30.0
+            action = model(observation)
+            observation, reward, done, info = step(action)
+            if done:
+                break
         return None
 
     def place_orders(self, actions: np.ndarray, *args, **kwargs):
@@ -34,17 +34,21 @@ Classes:
         proivde common functionalities for training agents.
 """
 from abc import ABC, abstractmethod
-import copy
-import inspect
+from functools import lru_cache, partial
+import multiprocessing as mp
+from multiprocessing import connection
 import os
-from typing import Optional, Tuple
+import pickle
+import time
+from typing import Callable, List, Optional, Tuple, Union
 
 import numpy as np
 
-from gym.vector import AsyncVectorEnv, SyncVectorEnv
 from stable_baselines3.common.vec_env import DummyVecEnv, SubprocVecEnv
+import torch
 from torch import nn
 
+from neural.common.log import logger
 from neural.data.base import DatasetMetadata, StaticDataFeeder
 from neural.env.base import TrainMarketEnv
 from neural.meta.agent import Agent
@@ -52,6 +56,230 @@ from neural.meta.pipe import AbstractPipe
 from neural.model.base import AbstractModel, StableBaselinesModel
 from neural.utils.io import from_hdf5
 
+# Parallel environment workers are started from a forkserver that has
+# the heavy modules pre-imported, so each SubprocVecEnv worker forks
+# from a warm process instead of re-importing torch, numpy and h5py
+# from scratch. The start method is passed to SubprocVecEnv per
+# construction rather than set as the process-global default, so
+# importing this module never overrides the start method chosen by an
+# embedding application. Preloading only configures the forkserver if
+# and when one is started.
+_START_METHOD = ('forkserver'
+                 if 'forkserver' in mp.get_all_start_methods() else None)
+if _START_METHOD is not None:
+    mp.set_forkserver_preload(
+        ['numpy', 'torch', 'h5py', 'neural.env.base', 'neural.meta.pipe'])
+
+
+@lru_cache(maxsize=8)
+def _from_hdf5_cached(file_path: str, dataset_name: Optional[str],
+                      mtime: float):
+    """
+    Caches the metadata and dataset handles loaded from an HDF5 file.
+    Multi-stage training constructs several trainers over the same
+    file; caching keyed on the absolute path, dataset name and file
+    modification time lets later trainers reuse the open handles
+    instead of re-reading the file, while a modified file naturally
+    misses the cache.
+
+    Args:
+    ----
+        file_path (str):
+            Absolute path to the HDF5 file.
+        dataset_name (Optional[str]):
+            Name of the dataset in the HDF5 file.
+        mtime (float):
+            Modification time of the file, part of the cache key.
+
+    Returns:
+    --------
+        Tuple[DatasetMetadata, List[h5.Dataset]]:
+            Metadata and dataset handles as returned by from_hdf5.
+    """
+    return from_hdf5(file_path, dataset_name)
+
+
+def _pin_worker_processes(market_env) -> None:
+    """
+    Pins each worker process of a vectorized environment to a distinct
+    CPU core, round-robin over the available cores. Keeping workers on
+    fixed cores avoids scheduler migrations and the cache-line
+    ping-pong they cause, which otherwise shows up as straggler noise
+    in lockstep vectorized stepping. A no-op on platforms without
+    sched_setaffinity or on in-process backends without workers.
+
+    Args:
+    ----
+        market_env:
+            The vectorized environment whose workers to pin.
+            stable-baselines3's SubprocVecEnv exposes its workers as a
+            processes attribute.
+    """
+    if not hasattr(os, 'sched_setaffinity'):
+        return None
+    processes = getattr(market_env, 'processes', None)
+    if not processes:
+        return None
+
+    n_cores = os.cpu_count() or 1
+    for index, process in enumerate(processes):
+        try:
+            os.sched_setaffinity(process.pid, {index % n_cores})
+        except OSError:
+            logger.warning('Could not pin env worker %d to a core.', index)
+    return None
+
+
+def _pipe_env(pipe: AbstractPipe, env: TrainMarketEnv) -> TrainMarketEnv:
+    """
+    Applies a pipe to an environment. Module-level so that environment
+    factory callables can be built with functools.partial, which
+    pickles compactly across the subprocess boundary instead of
+    shipping closure cells.
+
+    Args:
+    ----
+        pipe (AbstractPipe):
+            Pipe to apply.
+        env (TrainMarketEnv):
+            Environment to wrap.
+
+    Returns:
+    --------
+        TrainMarketEnv: The piped environment.
+    """
+    return pipe(env)
+
+
+class ReadyBatchVecEnv:
+    """
+    Adapter over SubprocVecEnv exposing an asynchronous send/recv
+    interface that returns as soon as ready_batch_size workers have
+    finished stepping, instead of blocking on the slowest of all
+    workers each step. With variable per-environment step times
+    (chunk boundaries, resets) lockstep stepping is gated by the
+    straggler; stepping the first M ready environments keeps the
+    model busy while slow workers catch up.
+
+    This is a building block for custom collection loops that can
+    consume partial batches. It is not returned by the trainers:
+    stable-baselines3 collection requires a VecEnv whose step returns
+    all environments at once, which is exactly the lockstep semantics
+    the partial-batch interface exists to avoid. A full-batch step is
+    provided so the adapter can also be driven by lockstep callers.
+
+    Attributes:
+    ----------
+        vec_env (SubprocVecEnv):
+            The wrapped subprocess vectorized environment.
+        ready_batch_size (int):
+            Number of ready workers to wait for per recv call.
+
+    Methods:
+    -------
+        reset() -> np.ndarray:
+            Resets all workers and returns the stacked observations.
+        send(env_ids, actions) -> None:
+            Dispatches one action to each of the given workers without
+            waiting for the results.
+        recv() -> Tuple[np.ndarray, np.ndarray, np.ndarray, list,
+        np.ndarray]:
+            Blocks until at least ready_batch_size dispatched workers
+            have stepped, and returns their stacked observations,
+            rewards, dones, infos, and environment ids.
+        step(actions) -> Tuple[np.ndarray, np.ndarray, np.ndarray,
+        list]:
+            Steps all workers in lockstep and returns full-batch
+            results in environment order.
+        close() -> None:
+            Shuts down the wrapped vectorized environment.
+    """
+
+    def __init__(self, vec_env: SubprocVecEnv,
+                 ready_batch_size: int) -> None:
+        self.vec_env = vec_env
+        self.ready_batch_size = min(ready_batch_size, vec_env.num_envs)
+        self._pending = dict()
+
+        return None
+
+    @property
+    def num_envs(self) -> int:
+        return self.vec_env.num_envs
+
+    @property
+    def observation_space(self):
+        return self.vec_env.observation_space
+
+    @property
+    def action_space(self):
+        return self.vec_env.action_space
+
+    def reset(self) -> np.ndarray:
+        self._pending.clear()
+        return self.vec_env.reset()
+
+    def send(self, env_ids, actions) -> None:
+        for env_id, action in zip(env_ids, actions):
+            remote = self.vec_env.remotes[env_id]
+            remote.send(('step', action))
+            self._pending[remote] = env_id
+        return None
+
+    def recv(self):
+        ready = list()
+        ready_set = set()
+        target = min(self.ready_batch_size, len(self._pending))
+        while len(ready) < target:
+            # remotes already collected are still readable until they
+            # are drained below, so wait only on the rest; waiting on
+            # all pending remotes would return duplicates.
+            newly_ready = connection.wait([
+                remote for remote in self._pending
+                if remote not in ready_set
+            ])
+            ready.extend(newly_ready)
+            ready_set.update(newly_ready)
+
+        env_ids, observations, rewards, dones, infos = (list(), list(),
+                                                        list(), list(),
+                                                        list())
+        for remote in ready:
+            observation, reward, done, info = remote.recv()
+            env_ids.append(self._pending.pop(remote))
+            observations.append(observation)
+            rewards.append(reward)
+            dones.append(done)
+            infos.append(info)
+
+        return (np.stack(observations), np.asarray(rewards),
+                np.asarray(dones), infos, np.asarray(env_ids))
+
+    def step(self, actions):
+        """
+        Steps every worker and blocks until all of them have finished,
+        reassembling the results in environment order. Lockstep
+        semantics for callers that cannot consume partial batches.
+        """
+        self.send(range(self.num_envs), actions)
+        observations = [None] * self.num_envs
+        rewards = np.empty(self.num_envs, dtype=np.float64)
+        dones = np.empty(self.num_envs, dtype=bool)
+        infos = [None] * self.num_envs
+        while self._pending:
+            (batch_observations, batch_rewards, batch_dones, batch_infos,
+             env_ids) = self.recv()
+            for position, env_id in enumerate(env_ids):
+                observations[env_id] = batch_observations[position]
+                rewards[env_id] = batch_rewards[position]
+                dones[env_id] = batch_dones[position]
+                infos[env_id] = batch_infos[position]
+        return np.stack(observations), rewards, dones, infos
+
+    def close(self) -> None:
+        self.vec_env.close()
+        return None
+
 
 class AbstractTrainer(ABC):
     """
@@ -178,8 +406,8 @@ class AbstractTrainer(ABC):
             the dataset is is used for training and the last 20% is used
             for testing. If train ratio is 1 then the entire dataset is
             used for training and no testing is performed.
-        _get_market_env() -> TrainMarketEnv | AsyncVectorEnv |
-        SyncVectorEnv:
+        _get_market_env() -> TrainMarketEnv | DummyVecEnv |
+        SubprocVecEnv:
             If n_envs = 1 or caller is test then a single environment is
             returned and agent's pipe is used to pipe the environment.
             when caller is train and n_envs > 1, deep copies of agent
@@ -239,6 +467,16 @@ class AbstractTrainer(ABC):
         self.exclusive_async_envs = exclusive_async_envs
         self.initial_cash_range = initial_cash_range
         self.initial_assets_range = initial_asset_quantities_range
+        self._async_env_pipes = None
+        self._train_market_env = None
+        self._test_market_env = None
+        # Per-trainer generator seeded from a fresh SeedSequence, on
+        # the SFC64 bit generator (roughly twice the throughput of the
+        # legacy Mersenne Twister). Avoids the lock-protected global
+        # legacy RandomState and keeps trainers decorrelated even when
+        # processes start from the same inherited global seed.
+        self._rng = np.random.Generator(
+            np.random.SFC64(np.random.SeedSequence()))
 
         if not 0 < train_ratio <= 1:
             raise ValueError("train_ratio must be in (0, 1]")
@@ -303,17 +541,37 @@ class AbstractTrainer(ABC):
                 train ratio is 1 then the second element of the tuple is
                 None.
         """
-        dataset_metadata, datasets = from_hdf5(self.file_path,
-                                               self.dataset_name)
+        dataset_metadata, datasets = _from_hdf5_cached(
+            os.path.abspath(self.file_path), self.dataset_name,
+            os.path.getmtime(self.file_path))
         if self.dataset_metadata is None:
             self.agent.dataset_metadata = dataset_metadata
-        elif not self.dataset_metadata == dataset_metadata:
+        elif hash(self.dataset_metadata) != hash(dataset_metadata):
             raise ValueError('Agent dataset metadata does not match metadata '
                              f'in path {self.file_path}.')
 
+        # On-disk HDF5 chunk rows should evenly divide the feeder chunk
+        # rows; otherwise every feeder chunk read straddles partial
+        # HDF5 chunks and repeats their load and decompression.
+        feeder_chunk_rows = dataset_metadata.n_rows // self.n_chunks
+        for dataset in datasets:
+            on_disk_chunks = getattr(dataset, 'chunks', None)
+            if on_disk_chunks is None:
+                continue
+            if feeder_chunk_rows % on_disk_chunks[0] != 0:
+                logger.warning(
+                    'Feeder chunk of %d rows is not a multiple of the '
+                    'on-disk HDF5 chunk of %d rows for dataset %s. Feeder '
+                    'chunk reads will re-read partial HDF5 chunks; consider '
+                    'adjusting n_chunks or rewriting the file with an '
+                    'aligned chunk layout.', feeder_chunk_rows,
+                    on_disk_chunks[0], dataset.name)
+
         data_feeder = StaticDataFeeder(metadata=dataset_metadata,
                                        datasets=datasets,
                                        n_chunks=self.n_chunks)
+        self._train_market_env = None
+        self._test_market_env = None
 
         if self.train_ratio == 1:
             train_data_feeder = data_feeder
@@ -324,95 +582,106 @@ class AbstractTrainer(ABC):
         return train_data_feeder, test_data_feeder
 
     def _get_market_env(
-            self) -> TrainMarketEnv | AsyncVectorEnv | SyncVectorEnv:
+            self,
+            mode: str) -> TrainMarketEnv | DummyVecEnv | SubprocVecEnv:
         """
-        If n_envs = 1 or caller is test then a single environment is
+        If n_envs = 1 or mode is 'test' then a single environment is
         returned and agent's pipe is used to pipe the environment. when
-        caller is train and n_envs > 1, deep copies of agent pipe is
+        mode is 'train' and n_envs > 1, clones of agent pipe are
         created. This is to avoid complications arised during parallel
         training and possibly modifying the same pipe object at the same
         time. Pipes created in parallel training will be saved for
         future reference so that when performing more paralell
         training state of the parallel pipes are preserved.
-        
+
         The common practice is to train on multiple environments and
         perform a final train/test on a single environement, to tune the
         observation normalizer stats to target account initial
         cash/assets.
 
+        Args:
+        ----
+            mode (str):
+                Either 'train' or 'test'; selects the data feeder and
+                whether the parallel path may be used.
+
         Returns:
         --------
-            TrainMarketEnv | AsyncVectorEnv | SyncVectorEnv:
-                Training environment. If n_envs = 1 or caller is test
+            TrainMarketEnv | DummyVecEnv | SubprocVecEnv:
+                Training environment. If n_envs = 1 or mode is 'test'
                 then a single environment is returned and agent's pipe
-                is used to pipe the environment. when caller is train
-                and n_envs > 1, deep copies of agent pipe is created.
-                if async_envs = True then an AsyncVectorEnv is returned,
-                otherwise a SyncVectorEnv is returned.
+                is used to pipe the environment. when mode is 'train'
+                and n_envs > 1, clones of agent pipe are created.
+                if async_envs = True then a SubprocVecEnv is returned,
+                otherwise a DummyVecEnv is returned.
         """
-        caller_name = inspect.stack()[1].function
-        if caller_name == 'train':
+        if mode == 'train':
             data_feeder = self.train_data_feeder
-        elif caller_name == 'test':
+        elif mode == 'test':
             data_feeder = self.test_data_feeder
-
-        def initial_cash() -> float | None:
-            """
-            Returns a random initial cash value. If initial_cash_range
-            is None then None is returned.
-
-            Returns:
-            --------
-                float: 
-                    Random initial cash value.
-            """
-            cash = np.random.uniform(
-                *self.initial_cash_range
-            ) if self.initial_cash_range is not None else None
-            return cash
-
-        def initial_asset_quantities() -> np.ndarray | None:
-            """
-            Returns a random initial asset quantities. If
-            initial_asset_quantities_range is None then None is
-            returned.
-
-            Returns:
-            --------
-                np.ndarray: 
-                    Random initial asset quantities.
-            """
-            n_assets = len(self.dataset_metadata.assets)
-            asset_quantities = np.random.uniform(
-                *self.initial_assets_range, size=len(n_assets, )
-            ) if self.initial_assets_range is not None else None
-            return asset_quantities
-
-        if self.n_async_envs == 1 or caller_name == 'test':
+        else:
+            raise ValueError(f"mode must be 'train' or 'test', got {mode}.")
+
+        # Initial conditions for all environments are drawn with one
+        # vectorized call per range instead of one RNG call per
+        # environment inside the construction loop.
+        n_assets = len(self.dataset_metadata.assets)
+        initial_cashes = (self._rng.uniform(
+            *self.initial_cash_range, size=self.n_async_envs)
+                          if self.initial_cash_range is not None else
+                          [None] * self.n_async_envs)
+        initial_asset_quantities = (self._rng.uniform(
+            *self.initial_assets_range, size=(self.n_async_envs, n_assets))
+                                    if self.initial_assets_range is not None
+                                    else [None] * self.n_async_envs)
+
+        if self.n_async_envs == 1 or mode == 'test':
             market_env = TrainMarketEnv(
                 data_feeder=data_feeder,
-                initial_cash=initial_cash(),
-                initial_asset_quantities=initial_asset_quantities())
+                initial_cash=initial_cashes[0],
+                initial_asset_quantities=initial_asset_quantities[0])
             market_env = self.pipe(market_env)
             return market_env
 
         if self.exclusive_async_envs:
             data_feeders = data_feeder.split(n=self.n_async_envs)
+        elif self.n_chunks == 1:
+            # When all parallel environments replay the same feeder and
+            # the dataset is loaded whole anyway, its datasets are moved
+            # into shared memory first so worker processes map the same
+            # pages rather than each materializing a private copy.
+            data_feeders = [data_feeder.to_shared()] * self.n_async_envs
         else:
+            # n_chunks > 1 means the dataset is too large to hold in
+            # memory at once; to_shared would materialize all of it, so
+            # workers keep the chunked lazy-loading path and rely on the
+            # OS page cache to share the underlying file data.
             data_feeders = [data_feeder] * self.n_async_envs
         async_envs = [
             TrainMarketEnv(data_feeder=data_feeder,
-                           initial_cash=initial_cash(),
-                           initial_asset_quantities=initial_asset_quantities())
-            for data_feeder in data_feeders
+                           initial_cash=initial_cashes[index],
+                           initial_asset_quantities=(
+                               initial_asset_quantities[index]))
+            for index, data_feeder in enumerate(data_feeders)
         ]
 
-        async_env_pipes = [
-            copy.deepcopy(self.agent.pipe) for _ in range(self.n_async_envs)
-        ]
+        # Each env gets its own pipe rebuilt from the agent pipe's
+        # serialized configuration: the pipe is pickled once and
+        # deserialized per env, putting the per-clone cost in the C
+        # pickle module instead of deepcopy's Python memo traversal.
+        # The clones are kept so resumed parallel training reuses their
+        # accumulated state.
+        if (self._async_env_pipes is None
+                or len(self._async_env_pipes) != self.n_async_envs):
+            pipe_blob = pickle.dumps(self.agent.pipe,
+                                     protocol=pickle.HIGHEST_PROTOCOL)
+            self._async_env_pipes = [
+                pickle.loads(pipe_blob) for _ in range(self.n_async_envs)
+            ]
+        async_env_pipes = self._async_env_pipes
 
         env_callables = [
-            lambda pipe=pipe, env=env: pipe(env)
+            partial(_pipe_env, pipe, env)
             for pipe, env in zip(async_env_pipes, async_envs)
         ]
 
@@ -427,7 +696,15 @@ class AbstractTrainer(ABC):
         Runs a single episode on the given environment. If random
         actions are used then the agent's model is not used to generate
         actions. This method is used to test the agent's performance on
-        the testing dataset.
+        the testing dataset. Vectorized environments are detected once
+        before the loop: their already-batched observations go through
+        a single forward pass instead of paying model-call overhead
+        per sub-environment, random actions are sampled per
+        sub-environment from the single-environment action space that
+        VecEnvs expose, and since VecEnvs auto-reset finished
+        sub-environments the episode ends once every sub-environment
+        has finished at least once. The loop runs under
+        torch.inference_mode to skip autograd bookkeeping entirely.
 
         Args:
         -----
@@ -436,16 +713,38 @@ class AbstractTrainer(ABC):
             random_actions (bool, optional):
                 If True, random actions are used. Defaults to False.
         """
-        
+        is_vectorized = isinstance(
+            env, (DummyVecEnv, SubprocVecEnv))
+
         observation = env.reset()
         model = self.model
-        while True:
-            action = model(
-                observation
-            ) if not random_actions else env.action_space.sample()
-            observation, reward, done, info = env.step(action)
-            if done:
-                break
+        done_once = (np.zeros(env.num_envs, dtype=bool)
+                     if is_vectorized else None)
+        # Autocast is deliberately not used here: SB3's predict converts
+        # actions to numpy internally and numpy has no bfloat16, so
+        # reduced-precision outputs cannot be cast back from outside the
+        # call. Deliberate reduced-precision inference goes through the
+        # model's quantize method instead.
+        with torch.inference_mode():
+            while True:
+                if random_actions:
+                    action = (np.stack([
+                        env.action_space.sample()
+                        for _ in range(env.num_envs)
+                    ]) if is_vectorized else env.action_space.sample())
+                else:
+                    action = model(observation)
+                observation, reward, done, info = env.step(action)
+                if is_vectorized:
+                    # VecEnvs auto-reset finished sub-environments, so
+                    # with unequal episode lengths all of them are
+                    # rarely done on the same step; track which have
+                    # finished at least once instead.
+                    done_once |= done
+                    if done_once.all():
+                        break
+                elif done:
+                    break
         return None
 
     def test(self, n_episodes: int = 1, n_warmup_episodes: int = 0) -> None:
@@ -472,7 +771,13 @@ class AbstractTrainer(ABC):
                              'Ensure train_ratio < 1. '
                              f'train_ratio = {self.train_ratio}')
 
-        test_market_env = self._get_market_env()
+        # The test environment is rebuilt only when the data feeders
+        # change, so periodic evaluation during multi-stage training
+        # does not pay the env construction and pipe-wrapping cost on
+        # every call.
+        if self._test_market_env is None:
+            self._test_market_env = self._get_market_env('test')
+        test_market_env = self._test_market_env
 
         for episode in range(n_warmup_episodes):
             self.run_episode(test_market_env, random_actions=True)
@@ -481,6 +786,20 @@ class AbstractTrainer(ABC):
 
         return None
 
+    def close(self) -> None:
+        """
+        Closes the cached training and testing environments, shutting
+        down any parallel worker processes they hold. Call when done
+        with the trainer; subsequent train/test calls rebuild the envs.
+        """
+        for market_env in (self._train_market_env, self._test_market_env):
+            if market_env is not None and hasattr(market_env, 'close'):
+                market_env.close()
+        self._train_market_env = None
+        self._test_market_env = None
+
+        return None
+
     @abstractmethod
     def get_async_env(self, *args, **kwargs) -> TrainMarketEnv:
         """
@@ -621,8 +940,8 @@ class StableBaselinesTrainer(AbstractTrainer):
             the dataset is is used for training and the last 20% is used
             for testing. If train ratio is 1 then the entire dataset is
             used for training and no testing is performed.
-        _get_market_env() -> TrainMarketEnv | AsyncVectorEnv |
-        SyncVectorEnv:
+        _get_market_env() -> TrainMarketEnv | DummyVecEnv |
+        SubprocVecEnv:
             If n_envs = 1 or caller is test then a single environment is
             returned and agent's pipe is used to pipe the environment.
             when caller is train and n_envs > 1, deep copies of agent
@@ -667,7 +986,7 @@ class StableBaselinesTrainer(AbstractTrainer):
                  async_envs: bool = True,
                  exclusive_envs: True = False,
                  initial_cash_range: Optional[Tuple[float, float]] = None,
-                 initial_assets_range: Optional[Tuple[float, float]] = None
+                 initial_assets_range: Optional[Tuple[float, float]] = None,
                  ) -> None:
 
         super().__init__(agent=agent,
@@ -679,19 +998,93 @@ class StableBaselinesTrainer(AbstractTrainer):
                          async_envs=async_envs,
                          exclusive_async_envs=exclusive_envs,
                          initial_cash_range=initial_cash_range,
-                         initial_asset_quantities_range=initial_assets_range
+                         initial_asset_quantities_range=initial_assets_range,
                          )
 
         return None
 
-    def get_async_env(self, env_callables) -> Union[DummyVecEnv, SubprocVecEnv]:
+    # Estimated fixed per-step cost of subprocess IPC framing beyond
+    # pickling the observation itself (scheduling, pipe round trip).
+    _IPC_FRAMING_NS = 50_000
+    _BENCHMARK_STEPS = 100
+
+    def _choose_vec_backend(
+            self,
+            env_callables: List[Callable]) -> Union[type, type]:
         """
-        Returns a vectorized environment for parallel training.
+        Selects the vectorization backend from a one-time
+        micro-benchmark. Subprocess vectorization only pays off when
+        per-step environment compute exceeds the per-step IPC cost of
+        shipping observations between processes; for a cheap numpy
+        step over preloaded chunks the in-process backend is often
+        faster. One environment is instantiated, its step latency is
+        timed, and the observation's pickled round trip is estimated;
+        the faster backend is returned and the choice is logged so it
+        can be overridden by setting async_envs explicitly.
+
+        Args:
+        ----
+            env_callables (List[Callable]):
+                Environment factory callables, as passed to the
+                vectorized environment constructors.
+
+        Returns:
+        --------
+            type: DummyVecEnv or SubprocVecEnv.
+        """
+        # The factories hold prebuilt env and pipe instances, so calling
+        # one here and again in the chosen backend would stack a second
+        # wrapper chain over the same underlying env whose feeder state
+        # and pipe statistics the benchmark already mutated. Benchmark
+        # on a throwaway clone instead, and close it afterwards.
+        benchmark_callable = pickle.loads(
+            pickle.dumps(env_callables[0], protocol=pickle.HIGHEST_PROTOCOL))
+        env = benchmark_callable()
+        try:
+            observation = env.reset()
+            action = env.action_space.sample()
+
+            start = time.perf_counter_ns()
+            for _ in range(self._BENCHMARK_STEPS):
+                observation, reward, done, info = env.step(action)
+                if done:
+                    observation = env.reset()
+            step_ns = (time.perf_counter_ns() -
+                       start) / self._BENCHMARK_STEPS
+
+            start = time.perf_counter_ns()
+            pickled_observation = pickle.dumps(observation)
+            pickle_ns = time.perf_counter_ns() - start
+            ipc_ns = 2 * pickle_ns + self._IPC_FRAMING_NS
+        finally:
+            env.close()
+
+        backend = SubprocVecEnv if step_ns > ipc_ns else DummyVecEnv
+        logger.info(
+            'Selected %s vectorization backend '
+            '(step: %.0fns, estimated IPC: %.0fns, observation: %d bytes).',
+            backend.__name__, step_ns, ipc_ns, len(pickled_observation))
+        return backend
+
+    def get_async_env(self,
+                      env_callables) -> Union[DummyVecEnv, SubprocVecEnv]:
+        """
+        Returns a vectorized environment for parallel training. With
+        async_envs set (the default) the subprocess backend is chosen
+        by a one-time micro-benchmark of environment step cost against
+        IPC cost; async_envs=False forces the in-process backend. Both
+        backends implement the stable-baselines3 VecEnv interface that
+        the model's train method requires.
         """
         if self.async_envs:
-            market_env = SubprocVecEnv(env_callables)
+            backend = self._choose_vec_backend(env_callables)
+        else:
+            backend = DummyVecEnv
+        if backend is SubprocVecEnv:
+            market_env = backend(env_callables, start_method=_START_METHOD)
         else:
-            market_env = DummyVecEnv(env_callables)
+            market_env = backend(env_callables)
+        _pin_worker_processes(market_env)
         return market_env
 
     def train(self,
@@ -715,7 +1108,12 @@ class StableBaselinesTrainer(AbstractTrainer):
                 Additional keyword arguments.
             
         """
-        market_env = self._get_market_env()
+        # The vectorized training env is cached across train() calls;
+        # spawning parallel workers is the dominant setup cost and the
+        # cache is invalidated whenever the data feeders are rebuilt.
+        if self._train_market_env is None:
+            self._train_market_env = self._get_market_env('train')
+        market_env = self._train_market_env
         for episode in range(n_warmup_episodes):
             self.run_episode(market_env, random_actions=True)
 
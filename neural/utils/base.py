@@ -5,7 +5,6 @@ import os
 from typing import List, Iterable, Any
 from collections import deque
 
-import pandas as pd
 import numpy as np
 
 import tableprint
@@ -19,7 +18,11 @@ class FillDeque:
     A custom deque implementation that fills itself with the first item
     it receives when it's empty until it reaches the specified buffer
     size. After that, it behaves like a regular deque with a fixed
-    maximum size.
+    maximum size. Numpy array items are stored in a preallocated
+    contiguous ring buffer, so appends overwrite a single row in place
+    and slices gather only the requested rows instead of materializing
+    the whole buffer; non-array items (e.g. observation dictionaries)
+    fall back to the original deque storage.
 
 
     Methods:
@@ -30,7 +33,7 @@ class FillDeque:
             reaches the maximum buffer size.
         __iter__:
             Returns an iterator over the deque.
-        __getitem__:    
+        __getitem__:
             Returns a slice of the deque.
         __len__:
             Returns the length of the deque.
@@ -40,13 +43,21 @@ class FillDeque:
             Returns a string representation of the deque.
         clear:
             Removes all elements from the deque buffer.
-    
+
     Attributes:
     -----------
-        buffer_size (int): 
+        buffer_size (int):
             The maximum size of the deque.
         buffer (deque):
-            The deque buffer.
+            The deque buffer, used for non-array items.
+        _ring (np.ndarray):
+            Preallocated (capacity, *item_shape) ring storage, used for
+            array items. Capacity is buffer_size rounded up to the next
+            power of two, so wrapping the write index is a single
+            bitwise AND instead of an integer division; the logical
+            buffer remains the last buffer_size rows written.
+        _head (int):
+            Next write position in the ring storage.
     """
 
     def __init__(self, buffer_size: int  = 10):
@@ -60,6 +71,10 @@ class FillDeque:
 
         self.buffer_size = buffer_size
         self.buffer = deque(maxlen=self.buffer_size)
+        self._capacity = 1 << (buffer_size - 1).bit_length()
+        self._mask = self._capacity - 1
+        self._ring = None
+        self._head = 0
 
         return None
 
@@ -67,13 +82,23 @@ class FillDeque:
         """
         Appends the item to the deque. If the deque is empty, it fills
         the deque with the first item received until it reaches the
-        maximum buffer size.
+        maximum buffer size. Array items allocate the ring storage on
+        first append and thereafter overwrite one row in place.
 
         Args:
         -----
             item (Any): The item to append to the deque.
         """
-        if not self.buffer:
+        if isinstance(item, np.ndarray):
+            if self._ring is None:
+                self._ring = np.empty((self._capacity, *item.shape),
+                                      dtype=item.dtype)
+                self._ring[:] = item
+                self._head = 0
+            else:
+                self._ring[self._head] = item
+                self._head = (self._head + 1) & self._mask
+        elif not self.buffer:
             for _ in range(self.buffer_size):
                 self.buffer.append(item)
         else:
@@ -81,6 +106,14 @@ class FillDeque:
 
         return None
 
+    def _ring_indices(self) -> np.ndarray:
+        """
+        Returns the physical row indices of the logical buffer (the
+        last buffer_size rows written) in oldest-to-newest order.
+        """
+        return (self._head - self.buffer_size +
+                np.arange(self.buffer_size)) & self._mask
+
     def __iter__(self) -> Iterable[Any]:
         """
         A generator that iterates over the deque.
@@ -88,33 +121,69 @@ class FillDeque:
         Returns:
             generator: A generator that iterates over the deque.
         """
+        if self._ring is not None:
+            return iter(self._ring[self._ring_indices()])
         return iter(self.buffer)
 
     def __getitem__(self, index) -> Any | List[Any]:
         """
-        Returns a slice of the buffer as a list.
+        Returns an item or slice of the buffer. For array items the
+        slice path gathers only the requested rows from the ring
+        storage into a numpy array, rather than copying the entire
+        buffer first.
 
         Args:
             index (int, slice): The index or slice to retrieve.
 
         Returns:
-            list: A list of items from the buffer.
+            The item at the index, or the sliced items as a numpy array
+            (ring storage) or list (deque storage).
         """
 
         if isinstance(index, int):
+            if self._ring is not None:
+                if index < 0:
+                    return self._ring[(self._head + index) & self._mask]
+                return self._ring[(self._head - self.buffer_size + index)
+                                  & self._mask]
             return self.buffer[index]
 
         elif isinstance(index, slice):
+            if self._ring is not None:
+                return self._ring[self._ring_indices()[index]]
             return list(self.buffer)[index]
 
         else:
             raise TypeError("Invalid argument type")
 
+    def as_stack(self) -> np.ndarray:
+        """
+        Returns the buffered items as an (buffer_size, *item_shape)
+        numpy array in oldest-to-newest order. When the logical buffer
+        occupies a contiguous range of the ring storage the result is a
+        zero-copy view; otherwise a single fancy-index gathers the rows
+        with no intermediate Python list.
+
+        Returns:
+        --------
+            np.ndarray: The stacked buffer contents. Views share memory
+            with the ring storage and are overwritten by later appends.
+        """
+        if self._ring is None:
+            return np.stack(list(self.buffer))
+        if self._head == 0:
+            return self._ring[self._capacity - self.buffer_size:]
+        if self._head >= self.buffer_size:
+            return self._ring[self._head - self.buffer_size:self._head]
+        return self._ring[self._ring_indices()]
+
     def clear(self) -> None:
         """
         Removes all elements from the deque buffer.
         """
         self.buffer.clear()
+        self._ring = None
+        self._head = 0
 
         return None
 
@@ -224,13 +293,15 @@ class RunningStatistics:
                 If the epsilon value is less than or equal to 0.
         """
 
-        if clip_threshold > 0:
-            raise AssertionError("clip_threshold must be greater than 0")   
-        if epsilon > 0:
-            raise AssertionError("epsilon value must be greater than 0")    
+        if clip_threshold <= 0:
+            raise AssertionError("clip_threshold must be greater than 0")
+        if epsilon <= 0:
+            raise AssertionError("epsilon value must be greater than 0")
 
         self.epsilon = epsilon
         self.clip_threshold = clip_threshold
+        self._std_dirty = True
+        self._inv_std = None
 
         self.shape = None
         self._minimum = None
@@ -311,15 +382,21 @@ class RunningStatistics:
     def std(self):
         """
         Computes and returns the standard deviation of the data stored
-        in the RunningStatistics object.
+        in the RunningStatistics object. The value is recomputed only
+        when the statistics have changed since the last read, and the
+        reciprocal (1 / (std + epsilon)) is cached alongside it so
+        normalize can multiply instead of divide.
         """
         if not self.count:
             raise AssertionError(
-                "Must have at least one data point to compute standard deviation")  
-        
-        variance = self.M2 / \
-            (self.count - 1) if self.count > 1 else np.zeros_like(self.M2)
-        self._std = np.sqrt(variance)
+                "Must have at least one data point to compute standard deviation")
+
+        if getattr(self, '_std_dirty', True) or self._std is None:
+            variance = self.M2 / \
+                (self.count - 1) if self.count > 1 else np.zeros_like(self.M2)
+            self._std = np.sqrt(variance)
+            self._inv_std = 1.0 / (self._std + self.epsilon)
+            self._std_dirty = False
 
         return self._std
 
@@ -347,6 +424,23 @@ class RunningStatistics:
         self.minimum = np.inf
         self.maximum = -np.inf
 
+        self._ensure_buffers()
+
+        return None
+
+    def _ensure_buffers(self) -> None:
+        """
+        Allocates the scratch buffers for the in-place update and
+        normalize paths. All per-step arithmetic writes into these, so
+        the steady-state transform performs no full-size array
+        allocations and runs entirely inside numpy ufunc loops, which
+        release the GIL. Statistics restored from older saved pipes
+        lack the buffers, hence the lazy allocation.
+        """
+        if not hasattr(self, '_delta') or self._delta.shape != self.shape:
+            self._delta = np.empty(self.shape)
+            self._scratch = np.empty(self.shape)
+            self._normalized = np.empty(self.shape)
         return None
 
     def update(self, array: np.ndarray):
@@ -374,17 +468,88 @@ class RunningStatistics:
                 'Shape of data has changed during update. '
                 f'original shape: {self.shape}, new shape: {array.shape}')
         
+        self._ensure_buffers()
         self.count += 1
-        delta = array - self._mean
-        self._mean += delta / self.count
-        delta2 = array - self._mean
-        self.M2 += delta * delta2
+        np.subtract(array, self._mean, out=self._delta)
+        np.divide(self._delta, self.count, out=self._scratch)
+        self._mean += self._scratch
+        np.subtract(array, self._mean, out=self._scratch)
+        self._delta *= self._scratch
+        self.M2 += self._delta
+        self._std_dirty = True
 
         self.minimum = np.minimum(self.minimum, array)
         self.maximum = np.maximum(self.maximum, array)
 
         return None
 
+    def update_batch(self, array: np.ndarray) -> None:
+        """
+        Updates the running statistics with a batch of data points in
+        one call. The batch mean and spread are computed with vectorized
+        numpy reductions and folded into the running statistics using
+        Chan's parallel combination of Welford states, so a batch of B
+        points costs a handful of numpy kernels instead of B update
+        calls.
+
+        Args:
+        -----
+            array (np.ndarray):
+                The batch of data, of shape (B, *shape) where shape
+                matches the per-point shape seen by update.
+
+        Raises:
+        -------
+            AssertionError:
+                If the per-point shape of the batch does not match the
+                shape of previously seen data.
+        """
+
+        if self.shape is None:
+            self.initialize_statistics(array[0])
+
+        if not self.shape == array.shape[1:]:
+            raise AssertionError(
+                'Shape of data has changed during update. '
+                f'original shape: {self.shape}, new shape: {array.shape[1:]}')
+
+        self._ensure_buffers()
+        batch_count = array.shape[0]
+        batch_mean = array.mean(axis=0)
+        batch_m2 = ((array - batch_mean)**2).sum(axis=0)
+
+        total_count = self.count + batch_count
+        np.subtract(batch_mean, self._mean, out=self._delta)
+        self._mean += self._delta * (batch_count / total_count)
+        self.M2 += batch_m2 + self._delta**2 * (
+            self.count * batch_count / total_count)
+        self.count = total_count
+        self._std_dirty = True
+
+        self.minimum = np.minimum(self.minimum, array.min(axis=0))
+        self.maximum = np.maximum(self.maximum, array.max(axis=0))
+
+        return None
+
+    def update_and_normalize(self, array: np.ndarray) -> np.ndarray:
+        """
+        Folds a new data point into the statistics and returns it
+        normalized, in one call. Keeps per-step consumers such as the
+        reward normalizer to a single method dispatch.
+
+        Args:
+        -----
+            array (np.ndarray):
+                The data point to update with and normalize.
+
+        Returns:
+        --------
+            np.ndarray: The normalized data, in the same reused buffer
+            returned by normalize.
+        """
+        self.update(array)
+        return self.normalize(array)
+
     def normalize(self, array: np.ndarray) -> np.ndarray:
         """
         Normalizes the data to a mean of 0 and standard deviation of 1.
@@ -397,13 +562,20 @@ class RunningStatistics:
 
         Returns:
         --------
-            np.ndarray: The normalized data.
+            np.ndarray: The normalized data. The returned array is a
+            reused internal buffer, overwritten by the next call; copy
+            it if it must outlive the current step.
         """
-        normalized_array = np.clip(
-            (array - self.mean) / (self.std + self.epsilon), -self.clip_threshold,
-            self.clip_threshold)
+        self._ensure_buffers()
+        # Reading std refreshes the cached reciprocal when statistics
+        # have changed since the last normalization.
+        self.std
+        np.subtract(array, self.mean, out=self._normalized)
+        self._normalized *= self._inv_std
+        np.clip(self._normalized, -self.clip_threshold, self.clip_threshold,
+                out=self._normalized)
 
-        return normalized_array
+        return self._normalized
 
 
 def validate_path(file_path: str | os.PathLike) -> None:
@@ -478,27 +650,123 @@ def tabular_print(entries: List,
 
 def progress_bar(iterable: Iterable) -> tqdm:
     """
-    Creates a progress bar using the tqdm library.
+    Creates a progress bar using the tqdm library. Terminal refreshes
+    are rate limited so that high-frequency update calls from inner
+    loops spend their time in the loop, not redrawing the bar.
 
     Args:
     -----
         iterable (Iterable):
-            The iterable to create the progress bar for. Progress bar is
-            shown based off of the length of the iterable.
+            The iterable, or total count, to create the progress bar
+            for. Progress bar is shown based off of the length of the
+            iterable.
 
     Returns:
     --------
         tqdm: The progress bar object.
     """
 
+    total = len(iterable) if hasattr(iterable, '__len__') else iterable
     bar_format = '{l_bar}{bar}| {n_fmt}/{total_fmt} | {elapsed}<{remaining}'
-    bar = tqdm(total=iterable, bar_format=bar_format)
+    bar = tqdm(total=total,
+               bar_format=bar_format,
+               mininterval=0.25,
+               miniters=1)
     return bar
 
 
 #=================================Financial====================================
 
 
+class SharpeTracker:
+    """
+    Incremental Sharpe ratio estimator over a net worth series. Each
+    net worth point folds its percentage return into a running Welford
+    mean and M2, so reading the current Sharpe ratio is O(1) instead of
+    a full pandas pass over the history on every call. Matches
+    sharpe_ratio semantics: returns are simple percentage changes and
+    the standard deviation uses one delta degree of freedom.
+
+    Attributes:
+    -----------
+        base (float):
+            The base value subtracted from the mean return.
+        count (int):
+            The number of net worth points consumed so far.
+
+    Methods:
+    --------
+        update(net_worth: float) -> None:
+            Folds the next net worth point into the running statistics.
+
+    Properties:
+    -----------
+        value (float):
+            The current Sharpe ratio, or nan while fewer than two
+            returns have been observed.
+    """
+
+    def __init__(self, base: float = 0):
+        """
+        Initializes the SharpeTracker instance.
+
+        Args:
+        -----
+            base (float, optional):
+                The base value subtracted from the mean return.
+                Defaults to 0.
+        """
+        self.base = base
+        self.count = 0
+
+        self._last_net_worth = None
+        self._mean = 0.0
+        self._m2 = 0.0
+
+        return None
+
+    def update(self, net_worth: float) -> None:
+        """
+        Folds the next net worth point into the running return
+        statistics. The first point only sets the reference for the
+        first return.
+
+        Args:
+        -----
+            net_worth (float):
+                The next net worth value in the series.
+        """
+        self.count += 1
+        if self._last_net_worth is not None:
+            return_ = net_worth / self._last_net_worth - 1
+            n_returns = self.count - 1
+            delta = return_ - self._mean
+            self._mean += delta / n_returns
+            self._m2 += delta * (return_ - self._mean)
+        self._last_net_worth = net_worth
+
+        return None
+
+    @property
+    def value(self) -> float:
+        """
+        The current Sharpe ratio of the consumed net worth series.
+
+        Returns:
+        --------
+            float: The Sharpe ratio, or nan while fewer than two
+            returns have been observed or the returns have zero
+            variance.
+        """
+        n_returns = self.count - 1
+        if n_returns < 2:
+            return float('nan')
+        std = np.sqrt(self._m2 / (n_returns - 1))
+        if std == 0:
+            return float('nan')
+        return (self._mean - self.base) / std
+
+
 def sharpe_ratio(net_worth_history: List[float], base=0):
     """
     Calculates the Sharpe ratio of a given net worth history list.
@@ -510,14 +778,17 @@ def sharpe_ratio(net_worth_history: List[float], base=0):
         base (float, optional):
             The base value to calculate the Sharpe ratio with. Defaults
             to 0.
-        
+
     Returns:
     --------
-        float: The Sharpe ratio of the net worth history.
+        float: The Sharpe ratio of the net worth history, or nan when
+        fewer than two points are available.
     """
 
-    hist = pd.Series(net_worth_history)
-    returns = hist.pct_change().dropna()
-    sharpe_ratio = (returns.mean() - base) / returns.std()
+    net_worth = np.asarray(net_worth_history, dtype=float)
+    if len(net_worth) < 2:
+        return float('nan')
+    returns = net_worth[1:] / net_worth[:-1] - 1
+    sharpe_ratio = (returns.mean() - base) / returns.std(ddof=1)
 
     return sharpe_ratio
@@ -3,9 +3,13 @@ io.py
 """
 
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import io
-from functools import reduce
+from functools import lru_cache
+from operator import itemgetter
+import pickle
 import tarfile
+import tempfile
 from typing import List, Optional, Tuple
 import os
 
@@ -18,9 +22,26 @@ from neural.common.exceptions import CorruptDataError
 from neural.data.base import DatasetMetadata
 from neural.utils.base import validate_path
 
-
-def to_hdf5(file_path: str | os.PathLike, numpy_array: np.ndarray,
-            dataset_metadata: DatasetMetadata, dataset_name: str):
+# Single worker that serializes metadata concurrently with the HDF5
+# array write: serialization is CPU-bound while the write releases the
+# GIL inside the HDF5 C library, so the two overlap.
+_metadata_serializer = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix='metadata-serializer')
+
+# Serialized metadata lives in a small companion uint8 dataset named
+# '<dataset_name>__meta'. HDF5 attributes are stored in the object
+# header, so rewriting one on every append re-serializes the whole
+# header; a resizable dataset supports cheap partial rewrites instead.
+_METADATA_SUFFIX = '__meta'
+
+
+def to_hdf5(file_path: str | os.PathLike,
+            numpy_array: np.ndarray,
+            dataset_metadata: DatasetMetadata,
+            dataset_name: str,
+            rdcc_nbytes: int = 64 << 20,
+            compression: Optional[str] = 'lzf',
+            store_dtype: Optional[np.dtype] = None):
     """
     Saves a numpy array to an HDF5 file. If the file does not exist, new
     file will be created. If file exists and dataset already exists, the
@@ -38,6 +59,26 @@ def to_hdf5(file_path: str | os.PathLike, numpy_array: np.ndarray,
             The metadata object for the dataset.
         dataset_name (str):
             The name of the dataset to save.
+        rdcc_nbytes (int):
+            Size of the HDF5 chunk cache in bytes. The default 64 MiB
+            keeps the chunks touched by an append resident instead of
+            evicting and re-reading them through the 1 MiB default
+            cache.
+        compression (Optional[str]):
+            Compression filter applied at dataset creation. The default
+            'lzf' ships with h5py and decompresses well below disk
+            bandwidth; combined with the byte-shuffle filter it packs
+            the slowly varying float columns tightly so reads move
+            fewer bytes. Pass None to store raw bytes. Only affects
+            newly created datasets.
+        store_dtype (Optional[np.dtype]):
+            On-disk dtype for newly created datasets. Passing a
+            narrower type such as np.float16 halves the bytes moved on
+            every append and read; the in-memory dtype stays at
+            GLOBAL_DATA_TYPE, with HDF5 converting on the fly. Only
+            appropriate for feature data whose dynamic range survives
+            the narrower type, e.g. after normalization. Defaults to
+            GLOBAL_DATA_TYPE.
     Raises:
     -------
         ValueError: 
@@ -52,42 +93,112 @@ def to_hdf5(file_path: str | os.PathLike, numpy_array: np.ndarray,
             f'Number of rows in numpy array: {len(numpy_array)}.'
             f'Number of rows in metadata: {dataset_metadata.n_rows}')
 
-    with h5.File(file_path, 'a') as hdf5:
+    _to_hdf5_raw(file_path=file_path,
+                 numpy_array=numpy_array,
+                 dataset_metadata=dataset_metadata,
+                 dataset_name=dataset_name,
+                 rdcc_nbytes=rdcc_nbytes,
+                 compression=compression,
+                 store_dtype=store_dtype)
+
+    return None
+
+
+def _to_hdf5_raw(file_path: str | os.PathLike,
+                 numpy_array: np.ndarray,
+                 dataset_metadata: DatasetMetadata,
+                 dataset_name: str,
+                 rdcc_nbytes: int = 64 << 20,
+                 compression: Optional[str] = 'lzf',
+                 store_dtype: Optional[np.dtype] = None):
+    """
+    Unchecked write path behind to_hdf5. Skips path validation and the
+    row-count consistency check, so callers appending in a tight loop
+    (e.g. at bar frequency) that already guarantee both invariants do
+    not re-pay them on every call. Arguments match to_hdf5.
+    """
+
+    # Explicit ~1 MiB chunks aligned to the full feature width.
+    # Auto-chunking (chunks=True) picks small chunks that split the
+    # feature axis, so every append rewrites partial chunks
+    # (read-modify-write). Whole-row chunks keep appends writing full
+    # chunks only.
+    effective_dtype = np.dtype(
+        store_dtype if store_dtype is not None else GLOBAL_DATA_TYPE)
+    # Coerce dtype and C-contiguity once up front; otherwise h5py
+    # silently makes its own full copy inside create_dataset or
+    # write_direct whenever the input dtype drifts (e.g. float64
+    # features into a float32 dataset) or the array is a strided view.
+    # A no-op when the array already conforms.
+    numpy_array = np.ascontiguousarray(numpy_array, dtype=effective_dtype)
+    rows_per_chunk = max(
+        1,
+        (1 << 20) // (numpy_array.shape[1] * effective_dtype.itemsize))
+
+    if not os.path.exists(file_path):
+        # The default free-space strategy fragments the file as
+        # datasets grow through repeated resizes. Paged allocation
+        # keeps each dataset's blocks together in pages sized to hold
+        # a whole chunk, so later sequential reads seek less. The
+        # strategy can only be set at file creation.
+        chunk_nbytes = (rows_per_chunk * numpy_array.shape[1] *
+                        effective_dtype.itemsize)
+        h5.File(file_path, 'w', fs_strategy='page',
+                fs_page_size=2 * chunk_nbytes, fs_persist=True).close()
+
+    # The slot count is a prime much larger than the number of cached
+    # chunks so the cache's hash table stays collision-free.
+    with h5.File(file_path, 'a', rdcc_nbytes=rdcc_nbytes,
+                 rdcc_nslots=100003, rdcc_w0=0.75) as hdf5:
 
         if dataset_name not in hdf5:
             dataset = hdf5.create_dataset(name=dataset_name,
                                           data=numpy_array,
-                                          dtype=GLOBAL_DATA_TYPE,
+                                          dtype=effective_dtype,
                                           maxshape=(HDF5_DEFAULT_MAX_ROWS,
                                                     numpy_array.shape[1]),
-                                          chunks=True)
-
-            serialized_dataset_metadata = dill.dumps(dataset_metadata,
-                                                     protocol=0)
-            dataset.attrs['metadata'] = serialized_dataset_metadata
+                                          chunks=(rows_per_chunk,
+                                                  numpy_array.shape[1]),
+                                          compression=compression,
+                                          shuffle=compression is not None)
+            dataset.attrs['rows_per_chunk'] = rows_per_chunk
+            dataset.attrs['store_dtype'] = effective_dtype.str
+
+            serialized_dataset_metadata = _dump_dataset_metadata(
+                dataset_metadata)
+            _write_metadata_blob(hdf5, dataset_name,
+                                 serialized_dataset_metadata)
 
         else:
             dataset_metadata_, dataset = extract_hdf5_dataset(
                 hdf5_file=hdf5, dataset_name=dataset_name)
 
             new_dataset_metadata = dataset_metadata_ + dataset_metadata
+            serialized_metadata_future = _metadata_serializer.submit(
+                _dump_dataset_metadata, new_dataset_metadata)
             dataset.resize(
                 (new_dataset_metadata.n_rows, new_dataset_metadata.n_features))
 
-            dataset[dataset_metadata_.n_rows:new_dataset_metadata.
-                    n_rows, :] = numpy_array
-            serialized_new_dataset_metadata = dill.dumps(new_dataset_metadata,
-                                                         protocol=0)
-
-            dataset.attrs['metadata'] = serialized_new_dataset_metadata
+            # write_direct skips __setitem__'s per-call selection and
+            # dataspace construction and writes the array in one call.
+            # cast to the dataset's on-disk dtype so appends match the
+            # layout chosen at creation, whatever store_dtype was then.
+            dataset.write_direct(
+                np.ascontiguousarray(numpy_array, dtype=dataset.dtype),
+                dest_sel=np.s_[dataset_metadata_.n_rows:new_dataset_metadata.
+                               n_rows, :])
+            _write_metadata_blob(hdf5, dataset_name,
+                                 serialized_metadata_future.result())
 
     return None
 
 
 def from_hdf5(
     file_path: str | os.PathLike,
-    dataset_name: Optional[str] = None
-) -> Tuple[DatasetMetadata, List[h5.Dataset]]:
+    dataset_name: Optional[str] = None,
+    rdcc_nbytes: int = 1 << 30,
+    materialize: bool = False
+) -> Tuple[DatasetMetadata, List[h5.Dataset | np.ndarray]]:
     """
     Loads a dataset from an HDF5 file. If dataset_name is not specified,
     all datasets in the file will be loaded. If dataset_name is
@@ -118,6 +229,16 @@ def from_hdf5(
         dataset_name (Optional[str]):
             The name of the dataset to load. If None, all datasets in
             the
+        rdcc_nbytes (int):
+            Size of the HDF5 chunk cache in bytes. The default 1 GiB
+            keeps recently read chunks resident so sequential chunked
+            reads do not re-hit the disk.
+        materialize (bool):
+            If True, each dataset is read once in full into a
+            preallocated numpy array via read_direct and the arrays are
+            returned instead of lazy handles. This trades memory for
+            read bandwidth: one contiguous read per dataset replaces
+            the per-chunk reads downstream slicing would issue.
     Returns:
     --------
         dataset_metadata (DatasetMetadata):
@@ -135,34 +256,75 @@ def from_hdf5(
 
     validate_path(file_path=file_path)
 
-    hdf5_file = h5.File(file_path, 'r')
+    # Datasets are returned as lazy handles sliced on demand by the
+    # feeders; the chunk cache keeps recently read chunks resident so
+    # sequential chunked reads do not re-hit the disk. The slot count
+    # is a prime much larger than the number of cached chunks to keep
+    # the cache's hash table collision-free.
+    hdf5_file = h5.File(file_path, 'r', rdcc_nbytes=rdcc_nbytes,
+                        rdcc_nslots=100003, rdcc_w0=0.75)
 
     if dataset_name is not None:
 
         dataset_metadata, dataset = extract_hdf5_dataset(
             hdf5_file=hdf5_file, dataset_name=dataset_name)
 
+        if materialize:
+            dataset = _materialize_dataset(dataset)
         return dataset_metadata, [dataset]
 
     dataset_list = list()
     dataset_metadata_list = list()
 
-    sorted_hdf5_file = sorted(
-        hdf5_file, key=lambda dataset: hdf5_file[dataset].id.get_offset())
-    for dataset_name in sorted_hdf5_file:
+    # A single low-level link traversal collects each dataset handle
+    # and its file offset; sorting the names with hdf5_file[name]
+    # inside the sort key would recreate every handle and round-trip to
+    # get_offset once per comparison, and the high-level visititems
+    # wraps every visited object in a throwaway group/dataset proxy.
+    name_dataset_offset_triples = list()
+
+    def _collect_dataset(link_name: bytes) -> None:
+        name = link_name.decode()
+        if name.endswith(_METADATA_SUFFIX):
+            return None
+        object_id = h5.h5o.open(hdf5_file.id, link_name)
+        if isinstance(object_id, h5.h5d.DatasetID):
+            name_dataset_offset_triples.append(
+                (name, h5.Dataset(object_id), object_id.get_offset()))
+        return None
+
+    hdf5_file.id.links.visit(_collect_dataset)
+    name_dataset_offset_triples.sort(key=itemgetter(2))
+
+    for dataset_name, dataset, _ in name_dataset_offset_triples:
         dataset_metadata, dataset = extract_hdf5_dataset(
-            hdf5_file=hdf5_file, dataset_name=dataset_name)
+            hdf5_file=hdf5_file, dataset_name=dataset_name, dataset=dataset)
 
         dataset_list.append(dataset)
         dataset_metadata_list.append(dataset_metadata)
 
+    if materialize:
+        # Each worker opens its own read-only handle so dataset reads
+        # can overlap instead of queueing on one handle; map preserves
+        # the offset-sorted order of the datasets.
+        dataset_names = [name for name, _, _ in name_dataset_offset_triples]
+        with ThreadPoolExecutor(
+                max_workers=min(8, len(dataset_names))) as executor:
+            dataset_list = list(
+                executor.map(
+                    lambda name: _read_dataset_copy(file_path, name),
+                    dataset_names))
+
     datasets_by_dataset_type_dict = defaultdict(list)
     for dataset, dataset_metadata in zip(dataset_list, dataset_metadata_list):
-        dataset_type = (
-            dataset_metadata.data_schema.data_type_assets_map.popitem()[0])
+        # next(iter(...)) reads the first key without popitem's
+        # mutation of the metadata object, which is reused by the
+        # merge below.
+        dataset_type = next(
+            iter(dataset_metadata.data_schema.data_type_assets_map))
         datasets_by_dataset_type_dict[dataset_type].append(dataset)
 
-    joined_metadata = reduce(lambda x, y: x | y, dataset_metadata_list)
+    joined_metadata = DatasetMetadata.merge_all(dataset_metadata_list)
     ordered_dataset_types = (
         joined_metadata.data_schema.data_type_assets_map.keys())
     ordered_dataset_list = [
@@ -174,10 +336,12 @@ def from_hdf5(
 
 def extract_hdf5_dataset(
         hdf5_file: h5.File,
-        dataset_name: str) -> Tuple[DatasetMetadata, h5.Dataset]:
+        dataset_name: str,
+        dataset: Optional[h5.Dataset] = None
+) -> Tuple[DatasetMetadata, h5.Dataset]:
     """
     Extracts a dataset from an HDF5 file and returns the dataset and its
-    metadata. 
+    metadata.
 
     Args:
     -------
@@ -185,35 +349,203 @@ def extract_hdf5_dataset(
             The HDF5 file to extract the dataset from.
         dataset_name (str):
             The name of the dataset to extract.
+        dataset (Optional[h5.Dataset]):
+            An already-opened handle for the dataset. When provided the
+            handle is reused instead of reopening it by name.
     Raises:
-    ------- 
+    -------
         ValueError:
             If the dataset does not exist in the file.
-        CorruptDataError:   
+        CorruptDataError:
             If the number of rows or columns in the dataset does not
-            match the number of rows or columns in the metadata.    
+            match the number of rows or columns in the metadata.
     """
 
-    try:
-        dataset = hdf5_file[dataset_name]
-    except KeyError as key_error:
-        raise ValueError(
-            f'Dataset {dataset_name} does not exist in file.') from key_error
-
-    serialized_dataset_metadata = dataset.attrs['metadata']
-    dataset_metadata = dill.loads(serialized_dataset_metadata.encode())
-
-    if dataset_metadata.n_rows != len(dataset):
-        raise CorruptDataError(f'Rows in {dataset_name}: {len(dataset)}.'
+    if dataset is None:
+        try:
+            dataset = hdf5_file[dataset_name]
+        except KeyError as key_error:
+            raise ValueError(f'Dataset {dataset_name} does not exist in '
+                             'file.') from key_error
+
+    metadata_dataset_name = dataset_name + _METADATA_SUFFIX
+    if metadata_dataset_name in hdf5_file:
+        serialized_dataset_metadata = (
+            hdf5_file[metadata_dataset_name][...].tobytes())
+    else:
+        # files written before the companion-dataset format keep the
+        # serialized metadata in an attribute.
+        serialized_dataset_metadata = _metadata_attr_bytes(
+            dataset.attrs['metadata'])
+    dataset_metadata = _load_dataset_metadata(serialized_dataset_metadata)
+
+    shape = dataset.shape
+    if dataset_metadata.n_rows != shape[0]:
+        raise CorruptDataError(f'Rows in {dataset_name}: {shape[0]}.'
                                f'Rows in metadata: {dataset_metadata.n_rows}')
-    if dataset_metadata.n_columns != dataset.shape[1]:
+    if dataset_metadata.n_columns != shape[1]:
         raise CorruptDataError(
-            f'Columns in {dataset_name}: {dataset.shape[1]}.'
+            f'Columns in {dataset_name}: {shape[1]}.'
             f'Columns in metadata: {dataset_metadata.n_columns}')
 
     return dataset_metadata, dataset
 
 
+def _write_metadata_blob(hdf5_file: h5.File, dataset_name: str,
+                         serialized_dataset_metadata: bytes) -> None:
+    """
+    Stores serialized metadata in the dataset's companion uint8
+    dataset, creating or resizing it as needed. Unlike an attribute
+    write, this touches only the blob's own chunks and leaves the main
+    dataset's object header alone.
+
+    Args:
+    -------
+        hdf5_file (h5.File):
+            The open HDF5 file.
+        dataset_name (str):
+            The name of the main dataset the metadata belongs to.
+        serialized_dataset_metadata (bytes):
+            The tagged serialized metadata bytes.
+    """
+
+    blob = np.frombuffer(serialized_dataset_metadata, dtype=np.uint8)
+    metadata_dataset_name = dataset_name + _METADATA_SUFFIX
+    if metadata_dataset_name in hdf5_file:
+        metadata_dataset = hdf5_file[metadata_dataset_name]
+        metadata_dataset.resize((len(blob), ))
+    else:
+        metadata_dataset = hdf5_file.create_dataset(
+            name=metadata_dataset_name,
+            shape=(len(blob), ),
+            dtype=np.uint8,
+            maxshape=(None, ))
+    metadata_dataset[:] = blob
+
+    return None
+
+
+def _materialize_dataset(dataset: h5.Dataset) -> np.ndarray:
+    """
+    Reads a dataset into memory with a single contiguous read_direct
+    call into a preallocated array. Downstream slicing of the returned
+    array is then plain numpy indexing with no HDF5 chunk pipeline in
+    the loop.
+
+    Args:
+    -------
+        dataset (h5.Dataset):
+            The dataset handle to materialize.
+    Returns:
+    --------
+        numpy_array (np.ndarray):
+            The full dataset contents.
+    """
+
+    numpy_array = np.empty(dataset.shape, dtype=GLOBAL_DATA_TYPE)
+    dataset.read_direct(numpy_array)
+    return numpy_array
+
+
+def _read_dataset_copy(file_path: str | os.PathLike,
+                       dataset_name: str) -> np.ndarray:
+    """
+    Opens its own read-only handle on the file and materializes one
+    dataset. Used by the thread pool in from_hdf5 so concurrent reads
+    do not contend on a shared file handle.
+
+    Args:
+    -------
+        file_path (str | os.PathLike):
+            The path to the HDF5 file.
+        dataset_name (str):
+            The name of the dataset to read.
+    Returns:
+    --------
+        numpy_array (np.ndarray):
+            The full dataset contents.
+    """
+
+    with h5.File(file_path, 'r') as hdf5_file:
+        return _materialize_dataset(hdf5_file[dataset_name])
+
+
+def _metadata_attr_bytes(metadata_attribute) -> Optional[bytes]:
+    """
+    Normalizes a metadata attribute value to bytes. Attributes written
+    by older versions of to_hdf5 are variable-length strings while the
+    current format stores opaque bytes (np.void); both are mapped to
+    the raw serialized bytes.
+
+    Args:
+    -------
+        metadata_attribute (str | bytes | np.void | None):
+            The attribute value as returned by h5py, or None when the
+            attribute is absent.
+    Returns:
+    --------
+        serialized_dataset_metadata (Optional[bytes]):
+            The raw serialized metadata bytes, or None.
+    """
+
+    if metadata_attribute is None:
+        return None
+    if isinstance(metadata_attribute, str):
+        return metadata_attribute.encode()
+    return bytes(metadata_attribute)
+
+
+def _dump_dataset_metadata(dataset_metadata: DatasetMetadata) -> bytes:
+    """
+    Serializes a dataset metadata object. Stdlib pickle at its highest
+    protocol is used when possible; dill is kept as a fallback for
+    metadata carrying objects pickle cannot handle. A one-byte tag
+    prefix records which serializer produced the payload.
+
+    Args:
+    -------
+        dataset_metadata (DatasetMetadata):
+            The metadata object to serialize.
+    Returns:
+    --------
+        serialized_dataset_metadata (bytes):
+            The tagged serialized metadata bytes.
+    """
+
+    try:
+        return b'P' + pickle.dumps(dataset_metadata,
+                                   protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError):
+        return b'D' + dill.dumps(dataset_metadata)
+
+
+@lru_cache(maxsize=128)
+def _load_dataset_metadata(
+        serialized_dataset_metadata: bytes) -> DatasetMetadata:
+    """
+    Deserializes a dataset metadata attribute. Results are memoized on
+    the serialized bytes so reopening the same file does not pay the
+    deserialization cost again.
+
+    Args:
+    -------
+        serialized_dataset_metadata (bytes):
+            The tagged serialized metadata attribute bytes.
+    Returns:
+    --------
+        dataset_metadata (DatasetMetadata):
+            The deserialized metadata object.
+    """
+
+    tag = serialized_dataset_metadata[:1]
+    if tag == b'P':
+        return pickle.loads(serialized_dataset_metadata[1:])
+    if tag == b'D':
+        return dill.loads(serialized_dataset_metadata[1:])
+    # untagged payloads predate the format tag and were written by dill.
+    return dill.loads(serialized_dataset_metadata)
+
+
 def get_file_like(object: object,
                   file_name: str) -> Tuple[tarfile.TarInfo, io.BytesIO]:
     """
@@ -243,19 +575,57 @@ def get_file_like(object: object,
         file_tar_info.size = os.path.getsize(path)
 
     else:
-        object_bytes = dill.dumps(object)
-        file = io.BytesIO(object_bytes)
+        # Serializing straight into a spooled file avoids holding a
+        # second full copy of the payload in RAM; payloads past 8 MiB
+        # overflow to disk transparently.
+        file = tempfile.SpooledTemporaryFile(max_size=8 << 20)
+        try:
+            pickle.dump(object, file, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError):
+            file.seek(0)
+            file.truncate()
+            dill.dump(object, file)
         file_tar_info = tarfile.TarInfo(name='dataset_metadata')
-        file_tar_info.size = len(object_bytes)
+        file_tar_info.size = file.tell()
+        file.seek(0)
 
     return file_tar_info, file
 
 
+def add_members_to_tarfile(
+        file_path: str | os.PathLike,
+        members: List[Tuple[tarfile.TarInfo, io.IOBase]]) -> None:
+    """
+    Adds a batch of file-like objects to a tarfile in a single open.
+    The archive is opened in append mode when it already exists, so
+    adding members across calls does not truncate earlier ones and
+    each batch pays one open/close instead of one per member.
+
+    Args:
+    -------
+        file_path (str | os.PathLike):
+            The path to the tarfile to add the files to.
+        members (List[Tuple[tarfile.TarInfo, io.IOBase]]):
+            Pairs of tar info and file-like objects, as produced by
+            get_file_like.
+    """
+
+    validate_path(file_path=file_path)
+    mode = 'a' if os.path.exists(file_path) else 'w'
+    with tarfile.open(file_path, mode, bufsize=1 << 20) as file:
+
+        for file_tar_info, file_like in members:
+            file.addfile(tarinfo=file_tar_info, fileobj=file_like)
+
+    return None
+
+
 def add_to_tarfile(file_path, file_tar_info, file_like):
     """
     Adds a file-like object to a tarfile. The file-like object can be
     created using the get_file_like function. Then this function can be
-    used to add the file to the tarfile specified by file_path.
+    used to add the file to the tarfile specified by file_path. Thin
+    wrapper around add_members_to_tarfile for the single-member case.
 
     Args:
     -------
@@ -267,9 +637,6 @@ def add_to_tarfile(file_path, file_tar_info, file_like):
             The file-like object to add.
     """
 
-    validate_path(file_path=file_path)
-    with tarfile.open(file_path, 'w') as file:
-
-        file.addfile(tarinfo=file_tar_info, fileobj=file_like)
+    add_members_to_tarfile(file_path, [(file_tar_info, file_like)])
 
     return None
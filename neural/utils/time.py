@@ -266,6 +266,13 @@ class Resolution:
             return self.quantity == other.quantity and self.unit == other.unit
         return False
 
+    def __hash__(self):
+        """
+        Hashes the resolution consistently with equality, namely by its
+        quantity and unit.
+        """
+        return hash((self.quantity, self.unit))
+
     def validate_resolution(self, quantity: int, unit: Unit):
         """
         Validates the resolution.
@@ -11,7 +11,7 @@ from neural.common.log import logger
 from neural.common.exceptions import IncompatibleWrapperError
 from neural.env.base import AbstractMarketEnv, TrainMarketEnv, TradeMarketEnv
 
-from neural.utils.base import sharpe_ratio, tabular_print
+from neural.utils.base import SharpeTracker, tabular_print
 
 
 def market(wrapper_class: Type[Wrapper]) -> Type[Wrapper]:
@@ -360,6 +360,14 @@ class AbstractMarketEnvMetadataWrapper(Wrapper, ABC):
         self.days = self.data_feeder.days
 
         self.history = defaultdict(list)
+        self._sharpe_tracker = SharpeTracker()
+        # last two equity points as scalars, so per-step consumers like
+        # the reward generator do not index the growing history list.
+        self.previous_equity = 0.0
+        self.current_equity = 0.0
+        # advanced once per reset/step; properties derived from the
+        # cached metadata key their memoized values on this id.
+        self._metadata_step_id = 0
 
     @property
     def date(self) -> pd.Timestamp:
@@ -534,8 +542,13 @@ class AbstractMarketEnvMetadataWrapper(Wrapper, ABC):
             sharpe (float):
                 The current sharpe ratio of the trader.
         """
-        sharpe = sharpe_ratio(self.history['equity'])
-        return sharpe
+        # Equity points are folded into the incremental tracker on
+        # demand, so reading the ratio costs O(new points) instead of a
+        # full pandas pass over the equity history per call.
+        equity_history = self.history['equity']
+        for equity in equity_history[self._sharpe_tracker.count:]:
+            self._sharpe_tracker.update(equity)
+        return self._sharpe_tracker.value
     
     @abstractmethod
     def _cache_metadata(self):
@@ -565,6 +578,7 @@ class AbstractMarketEnvMetadataWrapper(Wrapper, ABC):
         """
 
         observation = self.env.reset()
+        self._metadata_step_id += 1
         self._cache_metadata()
 
         return observation
@@ -595,6 +609,7 @@ class AbstractMarketEnvMetadataWrapper(Wrapper, ABC):
         """
 
         observation, reward, done, info = self.env.step(action)
+        self._metadata_step_id += 1
         self._cache_metadata()
 
         return observation, reward, done, info
@@ -849,13 +864,19 @@ class MarginAccountMetaDataWrapper(AbstractMarketEnvMetadataWrapper):
             self.marginable_equity - self.maintenance_margin_requirement)
         return excess_margin
 
+    # per-step memoization state for excess_margin_ratio; several
+    # wrappers read the property within the same step.
+    _cached_excess_margin_ratio = 0.0
+    _cached_excess_margin_ratio_step = -1
+
     @property
     def excess_margin_ratio(self):
         """
         Result of dividing excess margin by portfolio value. This metric
         can be used to determine the amount of cushion around the margin
         call threshold. Can be used to provide both protection and
-        guaranteed liquidity.
+        guaranteed liquidity. The value is constant within a step, so it
+        is computed once per step id and served from cache afterwards.
 
         Returns:
         ----------
@@ -863,9 +884,15 @@ class MarginAccountMetaDataWrapper(AbstractMarketEnvMetadataWrapper):
                 Excess margin ratio is the ratio of excess margin to
                 portfolio value.
         """
+        if self._cached_excess_margin_ratio_step == self._metadata_step_id:
+            return self._cached_excess_margin_ratio
+
         excess_margin = self.market_metadata_wrapper.excess_margin
         portfolio_value = self.market_metadata_wrapper.portfolio_value
         excess_margin_ratio = excess_margin / portfolio_value
+
+        self._cached_excess_margin_ratio = excess_margin_ratio
+        self._cached_excess_margin_ratio_step = self._metadata_step_id
         return excess_margin_ratio
     
     def _cache_metadata(self) -> None:
@@ -873,11 +900,15 @@ class MarginAccountMetaDataWrapper(AbstractMarketEnvMetadataWrapper):
         Caches metadata during an episode. This method is called by the
         `reset` and `step` methods of the wrapper.
         """
+        equity = self.equity
+        self.previous_equity = self.current_equity
+        self.current_equity = equity
+
         self.history['cash'].append(self.cash)
         self.history['longs'].append(self.longs)
         self.history['shorts'].append(self.shorts)
         self.history['portfolio_value'].append(self.portfolio_value)
-        self.history['equity'].append(self.equity)
+        self.history['equity'].append(equity)
         self.history['profit'].append(self.profit)
         self.history['return'].append(self.return_)
         self.history['sharpe'].append(self.sharpe)
@@ -1013,23 +1044,27 @@ class ConsoleTearsheetRenderWrapper(Wrapper):
         n_features = self.market_metadata_wrapper.n_features
 
         if isinstance(self.market_env, TradeMarketEnv):
-            logger.info('Beginning live trading:'
-                        f'\n\t resolution = {resolution}'
-                        f'\n\t n_assets = {n_assets}'
-                        f'\n\t n_features = {n_features:,}')
+            logger.info(
+                'Beginning live trading:'
+                '\n\t resolution = %s'
+                '\n\t n_assets = %s'
+                '\n\t n_features = %s', resolution, n_assets,
+                f'{n_features:,}')
         else:
             start_date = self.market_metadata_wrapper.start_date
             end_date = self.market_metadata_wrapper.end_date
             days = self.market_metadata_wrapper.days
             n_steps = self.market_metadata_wrapper.n_steps
-            logger.info('Episode:'
-                        f'\n\t start date= {start_date}'
-                        f'\n\t end date= {end_date}'
-                        f'\n\t days = {days}'
-                        f'\n\t resolution = {resolution}'
-                        f'\n\t n_assets = {n_assets}'
-                        f'\n\t n_steps = {n_steps:,}'
-                        f'\n\t n_features = {self.market_env.n_features:,}')
+            logger.info(
+                'Episode:'
+                '\n\t start date= %s'
+                '\n\t end date= %s'
+                '\n\t days = %s'
+                '\n\t resolution = %s'
+                '\n\t n_assets = %s'
+                '\n\t n_steps = %s'
+                '\n\t n_features = %s', start_date, end_date, days, resolution,
+                n_assets, f'{n_steps:,}', f'{self.market_env.n_features:,}')
 
         self.render()
         return observation
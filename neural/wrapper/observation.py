@@ -1147,7 +1147,10 @@ class ObservationStackerWrapper(ObservationWrapper):
         stack = self.observation_buffer_wrapper.observation_buffer[-self.
                                                                    stack_size:]
 
-        if isinstance(stack[0], np.ndarray):
+        if isinstance(stack, np.ndarray):
+            stacked_observation = stack
+
+        elif isinstance(stack[0], np.ndarray):
             stacked_observation = np.stack(stack)
 
         elif isinstance(stack[0], dict):
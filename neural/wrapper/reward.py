@@ -1,6 +1,9 @@
 """
 reward.py
 """
+from __future__ import annotations
+
+import math
 from typing import Optional
 from gym import Env
 from abc import ABC, abstractmethod
@@ -28,10 +31,8 @@ class RewardGeneratorWrapper(RewardWrapper):
 
     Attributes:
     ----------
-        env (gym.Env): 
-            The environment to wrap. equity_history
-        (list[float]): 
-            A list of equity values for each step in the episode.
+        env (gym.Env):
+            The environment to wrap.
 
     Methods:
     -------
@@ -45,14 +46,17 @@ class RewardGeneratorWrapper(RewardWrapper):
 
         Args:
         -------
-            env (gym.Env): 
+            env (gym.Env):
                 The environment to wrap.
         """
         super().__init__(env)
-        self.equity_history = self.market_metadata_wrapper.equity_history
 
     def reward(self, reward: float) -> float:
-        reward = self.equity_history[-1] - self.equity_history[-2]
+        # the metadata wrapper keeps the last two equity points as
+        # scalars; reading them is O(1) regardless of episode length.
+        metadata_wrapper = self.market_metadata_wrapper
+        reward = (metadata_wrapper.current_equity -
+                  metadata_wrapper.previous_equity)
         return reward
 
 
@@ -79,6 +83,7 @@ class RewardNormalizerWrapper(RewardWrapper):
         env: Env,
         epsilon: float = 1e-8,
         clip_threshold: float = np.inf,
+        max_update_steps: Optional[int] = None,
     ) -> None:
         """
         This wrapper normalizes immediate rewards so that rewards have
@@ -94,6 +99,12 @@ class RewardNormalizerWrapper(RewardWrapper):
                 The maximum value to clip the normalized reward. This is
                 useful to prevent the agent from receiving very large
                 rewards.
+            max_update_steps (Optional[int]):
+                Number of warmup updates after which the statistics are
+                frozen. Once frozen, rewards are normalized against the
+                fixed mean and a precomputed reciprocal of the standard
+                deviation, skipping the Welford bookkeeping per step.
+                None (the default) keeps updating forever.
 
         Example
         -------
@@ -107,8 +118,12 @@ class RewardNormalizerWrapper(RewardWrapper):
 
         self.epsilon = epsilon
         self.clip_threshold = clip_threshold
+        self.max_update_steps = max_update_steps
         self.reward_statistics = RunningStatistics(
             epsilon=self.epsilon, clip_threshold=self.clip_threshold)
+        self._update_count = 0
+        self._frozen_mean = None
+        self._frozen_inv_std = None
 
         return None
 
@@ -127,11 +142,155 @@ class RewardNormalizerWrapper(RewardWrapper):
             float: 
                 The normalized reward.
         """
-        self.reward_statistics.update(reward)
-        normalized_reward = self.reward_statistics.normalize(reward)
+        if isinstance(reward, np.ndarray) and reward.ndim > 0:
+            return self.batch_reward(reward)
+
+        if self._frozen_inv_std is not None:
+            # frozen path: one subtract, one multiply, two compares.
+            normalized_reward = ((reward - self._frozen_mean) *
+                                 self._frozen_inv_std)
+            clip_threshold = self.clip_threshold
+            return max(-clip_threshold, min(clip_threshold,
+                                            normalized_reward))
+
+        normalized_reward = self.reward_statistics.update_and_normalize(
+            reward)
+        self._update_count += 1
+        if (self.max_update_steps is not None
+                and self._update_count >= self.max_update_steps):
+            self._frozen_mean = float(self.reward_statistics.mean)
+            self._frozen_inv_std = 1.0 / (float(self.reward_statistics.std) +
+                                          self.epsilon)
 
         return normalized_reward
 
+    def batch_reward(self, rewards: np.ndarray) -> np.ndarray:
+        """
+        Normalize a batch of rewards, one per parallel environment, in
+        a single pass. The statistics absorb the whole batch through
+        one parallel-Welford combine and the normalization is one
+        vectorized subtract/divide/clip, instead of a Python round-trip
+        per environment.
+
+        Args:
+        --------
+            rewards (np.ndarray):
+                The immediate rewards to normalize, shaped (n_envs,).
+
+        Returns:
+        --------
+            np.ndarray:
+                The normalized rewards.
+        """
+        statistics = self.reward_statistics
+        rewards = np.asarray(rewards, dtype=np.float64)
+        statistics.update_batch(rewards)
+
+        normalized_rewards = ((rewards - statistics.mean) /
+                              (statistics.std + self.epsilon))
+        np.clip(normalized_rewards, -self.clip_threshold, self.clip_threshold,
+                out=normalized_rewards)
+        return normalized_rewards
+
+
+class EMARewardNormalizerWrapper(RewardWrapper):
+    """
+    Normalizes immediate rewards using bias-corrected exponential
+    moving averages of the first and second moments, in the style of
+    online reward normalization used by RND. Compared to
+    RewardNormalizerWrapper's running statistics this keeps only two
+    scalars of state, updates with two fused multiply-adds per step,
+    and tracks regime changes in the reward scale faster because old
+    rewards decay geometrically instead of being averaged forever.
+
+    Usage:
+    -------
+        env = EMARewardNormalizerWrapper(env, alpha=0.99,
+            clip_threshold=10)
+
+    Methods:
+    -------
+        reward(reward: float) -> float
+            Normalize the reward.
+    """
+
+    def __init__(
+        self,
+        env: Env,
+        alpha: float = 0.99,
+        epsilon: float = 1e-8,
+        clip_threshold: float = np.inf,
+    ) -> None:
+        """
+        Initializes the EMA reward normalizer wrapper.
+
+        Args:
+        -------
+            env (gym.Env):
+                The environment to wrap.
+            alpha (float):
+                The decay factor of the moving averages. Values closer
+                to 1 average over a longer horizon.
+            epsilon (float):
+                A small value to avoid division by zero.
+            clip_threshold (float):
+                The maximum magnitude of the normalized reward.
+
+        Raises:
+        -------
+            AssertionError:
+                If alpha is not in the open interval (0, 1).
+        """
+        super().__init__(env)
+
+        if not 0 < alpha < 1:
+            raise AssertionError('Alpha must be in the interval (0, 1). '
+                                 f'Current value: {alpha}')
+
+        self.alpha = alpha
+        self.epsilon = epsilon
+        self.clip_threshold = clip_threshold
+
+        self._one_minus_alpha = 1 - alpha
+        self._mean_ema = 0.0
+        self._second_moment_ema = 0.0
+        # alpha ** n maintained incrementally for the bias correction,
+        # avoiding a pow call per step.
+        self._alpha_power = 1.0
+
+        return None
+
+    def reward(self, reward: float) -> float:
+        """
+        Normalize the reward by the bias-corrected EMA estimate of its
+        standard deviation. This method should be the last wrapper in
+        the reward wrapper stack.
+
+        Args:
+        --------
+            reward (float):
+                The immediate reward to normalize.
+
+        Returns:
+        --------
+            float:
+                The normalized reward.
+        """
+        self._mean_ema = (self.alpha * self._mean_ema +
+                          self._one_minus_alpha * reward)
+        self._second_moment_ema = (self.alpha * self._second_moment_ema +
+                                   self._one_minus_alpha * reward * reward)
+        self._alpha_power *= self.alpha
+
+        bias_correction = 1.0 - self._alpha_power
+        mean = self._mean_ema / bias_correction
+        second_moment = self._second_moment_ema / bias_correction
+        std = math.sqrt(max(second_moment - mean * mean, 0.0) + self.epsilon)
+
+        normalized_reward = reward / std
+        clip_threshold = self.clip_threshold
+        return max(-clip_threshold, min(clip_threshold, normalized_reward))
+
 
 @metadata
 class LiabilityInterstRewardWrapper(RewardWrapper):
@@ -175,20 +334,39 @@ class LiabilityInterstRewardWrapper(RewardWrapper):
 
     def __init__(self, env, interest_rate=0.08):
         super().__init__(env)
-        self.interest_rate = interest_rate
+        self._interest_rate = interest_rate
+        self._daily_interest_rate = interest_rate / 360
         self.previous_day = None
 
+    @property
+    def interest_rate(self):
+        """
+        The annual interest rate charged on liabilities.
+
+        Returns:
+        --------
+            float:
+                The annual interest rate.
+        """
+        return self._interest_rate
+
+    @interest_rate.setter
+    def interest_rate(self, interest_rate):
+        self._interest_rate = interest_rate
+        self._daily_interest_rate = interest_rate / 360
+
     @property
     def daily_interest_rate(self):
         """
-        Compute the daily interest rate.
+        The daily interest rate, precomputed when the annual rate is
+        set so the reward path does not redo the division per step.
 
         Returns:
         --------
             float:
                 The daily interest rate.
         """
-        return self.interest_rate / 360
+        return self._daily_interest_rate
 
     def reset(self) -> np.ndarray[float] | Dict[str, np.ndarray[float]]:
         """
@@ -237,15 +415,33 @@ class LiabilityInterstRewardWrapper(RewardWrapper):
             float:
                 The interest to charge on liabilities.
         """
-        cash_debt = abs(min(self.market_metadata_wrapper.cash, 0))
-
-        positions = self.market_metadata_wrapper.positions
-        asset_quantitties = self.market_metadata_wrapper.asset_quantities
-        asset_debt = sum(
-            position for position, quantity in zip(positions, asset_quantitties)
-            if quantity < 0)
-
-        debt_interest = (cash_debt + asset_debt) * self.daily_interest_rate
+        # one attribute fetch of the metadata wrapper instead of one
+        # per chained lookup below.
+        metadata_wrapper = self.market_metadata_wrapper
+        cash = metadata_wrapper.cash
+        cash_debt = -cash if cash < 0.0 else 0.0
+
+        asset_quantities = np.asarray(metadata_wrapper.asset_quantities)
+        # all-long books are the common case; a single min reduction
+        # skips the masked sum entirely when nothing is borrowed.
+        if asset_quantities.min() >= 0:
+            if cash_debt == 0:
+                return 0.0
+            asset_debt = 0.0
+        else:
+            positions = np.asarray(metadata_wrapper.positions)
+            if asset_quantities.size < 32:
+                asset_debt = float(positions[asset_quantities < 0].sum())
+            else:
+                # for larger universes a dot against the 0/1 mask runs
+                # as a single BLAS multiply-accumulate, beating the
+                # mask-then-sum two-pass form; below the crossover the
+                # BLAS call overhead dominates.
+                mask = (asset_quantities < 0).astype(positions.dtype,
+                                                     copy=False)
+                asset_debt = float(positions @ mask)
+
+        debt_interest = (cash_debt + asset_debt) * self._daily_interest_rate
 
         return debt_interest
 
@@ -367,7 +563,46 @@ class AbstractRewardShaper(RewardWrapper, ABC):
 
         self.use_std = use_std
         self.use_min = use_min
-        self.reward_statistics = RunningStatistics()
+        # the shaping mode is fixed for the lifetime of the wrapper, so
+        # the min/max/std dispatch is resolved once here instead of
+        # re-branching on every shaped step.
+        if use_min is not None:
+            self.shape_reward = (self._shape_min
+                                 if use_min else self._shape_max)
+        else:
+            self.shape_reward = self._shape_std
+        self.reward_statistics = self._find_shared_reward_statistics(env)
+        self._owns_reward_statistics = self.reward_statistics is None
+        if self._owns_reward_statistics:
+            self.reward_statistics = RunningStatistics()
+        self._step_id = 0
+
+    @staticmethod
+    def _find_shared_reward_statistics(
+            env: Env) -> Optional[RunningStatistics]:
+        """
+        Walks the wrapped environment chain looking for a reward shaper
+        that already tracks reward statistics. Stacked shapers observe
+        the same reward stream, so they share one RunningStatistics
+        instance instead of each folding every reward into its own copy.
+        Only the innermost shaper (the owner) updates it per step.
+
+        Args:
+        -----
+            env (Env):
+                The environment being wrapped.
+
+        Returns:
+        --------
+            Optional[RunningStatistics]:
+                The statistics of the innermost shaper in the chain, or
+                None if this is the first shaper in the stack.
+        """
+        while env is not None:
+            if isinstance(env, AbstractRewardShaper):
+                return env.reward_statistics
+            env = getattr(env, 'env', None)
+        return None
 
     @property
     @abstractmethod
@@ -399,26 +634,39 @@ class AbstractRewardShaper(RewardWrapper, ABC):
         """
         raise NotImplementedError
 
-    def shape_reward(self) -> float:
+    def _shape_min(self) -> float:
+        """
+        Shaped reward for use_min=True: scale * minimum reward seen.
+
+        Returns
+        -------
+            float
+                A float value representing the shaped reward.
+        """
+        return self.scale * self.reward_statistics.minimum
+
+    def _shape_max(self) -> float:
         """
-        Calculate the shaped reward based on scale and reward statistics.
-        Outpus a scalar that is either mean + scale * std or scale * min/max.
+        Shaped reward for use_min=False: scale * maximum reward seen.
 
         Returns
         -------
             float
                 A float value representing the shaped reward.
         """
-        if self.use_min is not None:
-            shaped_reward = (self.scale * self.reward_statistics.minimum
-                             if self.use_min else self.scale *
-                             self.reward_statistics.maximum)
+        return self.scale * self.reward_statistics.maximum
 
-        elif self.use_std is not None:
-            shaped_reward = (self.reward_statistics.mean +
-                             self.scale * self.reward_statistics.std)
+    def _shape_std(self) -> float:
+        """
+        Shaped reward for use_std=True: mean + scale * std of rewards.
 
-        return shaped_reward
+        Returns
+        -------
+            float
+                A float value representing the shaped reward.
+        """
+        return (self.reward_statistics.mean +
+                self.scale * self.reward_statistics.std)
 
     def reward(self, reward: float) -> float:
         """
@@ -464,11 +712,17 @@ class AbstractRewardShaper(RewardWrapper, ABC):
                 A dictionary containing additional information about the
                 environment.
         """
+        # advancing the step id invalidates any per-step memoized
+        # quantities (e.g. the dynamic shaper's deviation ratio).
+        self._step_id += 1
         observation, reward, done, info = self.env.step(action)
-        self.reward_statistics.update(reward)
+        if self._owns_reward_statistics:
+            self.reward_statistics.update(reward)
 
+        # calling reward() here would re-run check_condition inside it;
+        # shape directly so the predicate is evaluated once per step.
         if self.check_condition():
-            reward = self.reward(reward)
+            reward = self.shape_reward()
 
         return observation, reward, done, info
 
@@ -585,20 +839,8 @@ class AbstractFixedRewardShaper(AbstractRewardShaper, ABC):
             AssertionError:
                 If both `use_min` and `use_std` parameters are set to a
         """
-        super().__init__(env)
-        if use_min is not None and use_std is not None:
-            raise AssertionError(
-                "Cannot set both use_min and use_std parameters at the same time."
-            )
-
-        if use_min is None and use_std is None:
-            raise AssertionError(
-                "Either use_min or use_std parameter must be set.")
-
-        self.use_std = use_std
-        self.use_min = use_min
+        super().__init__(env, use_std=use_std, use_min=use_min)
         self._scale = scale
-        self.reward_statistics = RunningStatistics()
 
     @property
     def scale(self) -> float:
@@ -705,6 +947,17 @@ class AbstractDynamicRewardShaper(AbstractRewardShaper, ABC):
             raise AssertionError("Base must be greater than or equal to 1.")
         self.multiplier = multiplier
         self.base = base
+        # base ** x is the generic pow path; exp(log(base) * x) with a
+        # constant log(base) is cheaper and base is fixed per wrapper.
+        self._log_base = math.log(base)
+        # the multiplier's sign is constant per episode; precomputing
+        # it avoids a np.sign ufunc dispatch on every scale access.
+        self._multiplier_sign = ((multiplier > 0) - (multiplier < 0)
+                                 if multiplier is not None else None)
+        self._multiplier_abs = (abs(multiplier)
+                                if multiplier is not None else None)
+        self._cached_step_id = -1
+        self._cached_deviation_ratio = 0.0
 
     @property
     @abstractmethod
@@ -757,10 +1010,15 @@ class AbstractDynamicRewardShaper(AbstractRewardShaper, ABC):
                 The scaling factor for the shaped reward.
         """
 
-        scale = (
-            np.sign(self.multiplier) *
-            np.power(self.base, abs(self.deviation_ratio * self.multiplier)))
-        scale = 0 if self.deviation_ratio <= 1 else scale
+        deviation_ratio = self.deviation_ratio
+        if deviation_ratio <= 1:
+            return 0
+        # the ratio is non-negative so only the multiplier's magnitude
+        # matters in the exponent; sign, magnitude and log(base) are
+        # all precomputed constants.
+        scale = (self._multiplier_sign *
+                 math.exp(self._log_base * deviation_ratio *
+                          self._multiplier_abs))
         return scale
 
     @property
@@ -772,20 +1030,36 @@ class AbstractDynamicRewardShaper(AbstractRewardShaper, ABC):
 
         Returns:
         --------
-            float: 
+            float:
                 The ratio of metric to threshold.
+        Notes:
+        ------
+            check_condition and scale both read this ratio each step,
+            and metric/threshold can be costly metadata-wrapper
+            lookups, so the value is memoized against the step id and
+            both fetch each underlying property exactly once per step.
         """
-
-        if not self.threshold > 0:
-            raise AssertionError(f'Threshold must be greater than 0. '
-                                 f'Current value: {self.threshold}')
-
-        if not self.metric >= 0:
-            raise AssertionError(f'Metric must be greater than or equal to 0. '
-                                 f'Current value: {self.metric}')
-
-        ratio = self.metric / self.threshold
-        return ratio if ratio > 1 else 0
+        if self._cached_step_id == self._step_id:
+            return self._cached_deviation_ratio
+
+        threshold = self.threshold
+        metric = self.metric
+        # sanity checks on the subclass-provided properties; compiled
+        # out under python -O along with their comparisons.
+        if __debug__:
+            if not threshold > 0:
+                raise AssertionError(f'Threshold must be greater than 0. '
+                                     f'Current value: {threshold}')
+            if not metric >= 0:
+                raise AssertionError(
+                    f'Metric must be greater than or equal to 0. '
+                    f'Current value: {metric}')
+
+        ratio = metric / threshold
+        ratio = ratio if ratio > 1 else 0
+        self._cached_step_id = self._step_id
+        self._cached_deviation_ratio = ratio
+        return ratio
 
     def check_condition(self) -> bool:
         """
@@ -799,7 +1073,7 @@ class AbstractDynamicRewardShaper(AbstractRewardShaper, ABC):
             bool:
                 True if the reward should be shaped, False otherwise.
         """
-        return True if self.deviation_ratio > 1 else False
+        return self.deviation_ratio > 1
 
 
 @metadata
@@ -827,13 +1101,11 @@ class FixedExcessMarginRatioRewardShaper(AbstractFixedRewardShaper):
 
     def check_condition(self) -> bool:
         """
-        An abstract method for checking whether to apply reward shaping.
+        Checks whether the excess margin ratio has fallen below the
+        threshold, in which case the reward is shaped.
         """
-        excess_margin_ratio = self.market_metadata_wrapper.excess_margin_ratio
-        if excess_margin_ratio < self.excess_margin_ratio_threshold:
-            return True
-        else:
-            return False
+        return (self.market_metadata_wrapper.excess_margin_ratio <
+                self.excess_margin_ratio_threshold)
 
 
 @metadata
@@ -869,6 +1141,7 @@ class DynamicExcessMarginRewardShaper(AbstractDynamicRewardShaper):
     def __init__(
         self,
         env: Env,
+        excess_margin_ratio_threshold: float = 0.2,
         use_std: bool = None,
         use_min: bool = None,
         multiplier: Optional[float] = None,
@@ -880,6 +1153,15 @@ class DynamicExcessMarginRewardShaper(AbstractDynamicRewardShaper):
                          multiplier=multiplier,
                          base=base)
 
+        if excess_margin_ratio_threshold <= 0:
+            raise AssertionError(
+                'Excess margin ratio threshold must be a positive number.')
+
+        self.excess_margin_ratio_threshold = excess_margin_ratio_threshold
+        # the shaping threshold is the constant reciprocal of the user
+        # threshold; computing it here removes a division per access.
+        self._threshold = 1.0 / excess_margin_ratio_threshold
+
     @property
     def threshold(self) -> float:
         """
@@ -890,11 +1172,11 @@ class DynamicExcessMarginRewardShaper(AbstractDynamicRewardShaper):
 
         Returns:
         --------
-            float: 
+            float:
                 The threshold for the excess margin ratio reward
                 shaping.
         """
-        return 1 / self.excess_margin_ratio_threshold
+        return self._threshold
 
     @property
     def metric(self) -> float:
@@ -906,3 +1188,19 @@ class DynamicExcessMarginRewardShaper(AbstractDynamicRewardShaper):
         """
         excess_margin_ratio = self.market_metadata_wrapper.excess_margin_ratio
         return 1 / excess_margin_ratio
+
+    def check_condition(self) -> bool:
+        """
+        Checks whether the excess margin ratio has fallen below the
+        threshold. Compares the ratio to the threshold directly, which
+        is equivalent to the base class comparing their reciprocals but
+        skips both divisions on the common healthy-account path; the
+        deviation ratio is only computed when shaping actually fires.
+
+        Returns:
+        --------
+            bool:
+                True if the reward should be shaped, False otherwise.
+        """
+        return (self.market_metadata_wrapper.excess_margin_ratio <
+                self.excess_margin_ratio_threshold)
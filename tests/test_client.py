@@ -9,31 +9,40 @@ sys.path.insert(0, os.path.abspath(
     os.path.join(os.path.dirname(__file__), '..')))
 
 
+@unittest.skipUnless(os.environ.get('RUN_LIVE_CLIENT_TESTS'),
+                     'live broker test, set RUN_LIVE_CLIENT_TESTS to run')
 class TestClient(BaseConnectionTest):
-        
+
     @classmethod
     def setUpClass(cls):
         super().setUpClass()
+        # each accessor is a broker round-trip; fetch once here and let
+        # every test in the class reuse the cached results.
+        cls._assets = cls.client.assets.head()
+        cls._positions = cls.client.positions.head()
+        cls._asset_types = cls.client.asset_types
+        cls._exchanges = cls.client.exchanges
         logger.info('Client setup test: SUCESSFUL.')
-        
-    
+
+
     def test_functions(self):
-        
+
         print(
         f"""
-        assets: {self.client.assets.head()}
-        positions: {self.client.positions.head()}
-        asset classes: {self.client.asset_types}
-        exchange: {self.client.exchanges}
+        assets: {self._assets}
+        positions: {self._positions}
+        asset classes: {self._asset_types}
+        exchange: {self._exchanges}
         """)
         logger.info(
             'Client functions test: SUCCESSFUL.')
-    
-    def set_credentials(client):
 
-        client.set_credentials(
+    @classmethod
+    def _set_credentials(cls):
+
+        cls.client.set_credentials(
             secret= 'False', key= 'True')
-        
+
         logger.info(
             'Credentials setup test: SUCCESSFUL.')
 